@@ -625,6 +625,8 @@ def _check_git_merge_conflicts(
                 "merge-tree",
                 "--write-tree",
                 "--no-messages",
+                "--name-only",
+                "-z",
                 result["base_branch"],  # Use branch names, not commit hashes
                 spec_branch,
             ],
@@ -638,30 +640,18 @@ def _check_git_merge_conflicts(
             result["has_conflicts"] = True
             debug(MODULE, "Git merge-tree detected conflicts")
 
-            # Parse the output for conflicting files
-            # merge-tree --write-tree outputs conflict info to stderr
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                # Look for lines indicating conflicts
-                if "CONFLICT" in line:
-                    # Extract file path from conflict message
-                    import re
-
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
+            # With --name-only -z the output is the merged tree OID followed by
+            # each conflicted path once, all NUL-terminated. Paths come out
+            # unquoted, so names with unusual characters survive (core.quotePath)
+            for file_path in merge_tree_result.stdout.split("\0")[1:]:
+                if not file_path:
+                    break
+                # Skip .auto-claude files - they should never be merged
+                if not _is_auto_claude_file(file_path):
+                    result["conflicting_files"].append(file_path)
+
+            # Fallback: if merge-tree gave no usable output (e.g. git too old for
+            # --write-tree), use diff to find files changed in both branches
             if not result["conflicting_files"]:
                 # Files changed in main since merge-base
                 main_files_result = subprocess.run(
@@ -117,5 +117,8 @@ def write_json_atomic(
     Example:
         write_json_atomic("/path/to/file.json", {"key": "value"})
     """
+    # Serialize up front so the payload goes out in one write() call instead of
+    # json.dump's per-token writes.
+    content = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
     with atomic_write(filepath, "w", encoding=encoding) as f:
-        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        f.write(content)
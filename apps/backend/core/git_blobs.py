@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Git Blob Reading
+================
+
+Read file contents from git refs without forking ``git show`` per file.
+
+Kept apart from core.workspace so the merge package can share a reader
+without importing the workspace modules. Depends only on git_executable.
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+
+from core.git_executable import get_git_executable, get_isolated_git_env
+
+try:
+    import pygit2  # Optional: read git objects in-process via libgit2
+except ImportError:
+    pygit2 = None
+
+__all__ = ["GitBlobReader"]
+
+
+# Read-only queries don't need the index refresh lock or translated messages
+_GIT_QUERY_ENV_OVERRIDES = {"GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+
+def _git_query(
+    project_dir: Path,
+    args: list[str],
+    timeout: int = 60,
+    input_data: bytes | None = None,
+) -> bytes | None:
+    """
+    Run a read-only git command and return its raw stdout.
+
+    Skips text decoding and stderr capture, which run_git() always pays for.
+    input_data, if given, is written to git's stdin.
+
+    Returns:
+        stdout bytes on success, or None if git failed or could not run
+    """
+    env = get_isolated_git_env()
+    env.update(_GIT_QUERY_ENV_OVERRIDES)
+    try:
+        result = subprocess.run(
+            [get_git_executable(), *args],
+            cwd=project_dir,
+            input=input_data,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            env=env,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _decode_git_text(data: bytes) -> str:
+    """Decode blob bytes the way run_git() text output is decoded."""
+    # subprocess text mode also translates newlines; keep results identical
+    text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class GitBlobReader:
+    """
+    Read file contents from git refs through one ``git cat-file --batch`` process.
+
+    Replaces a ``git show`` fork per file with a request/response exchange on a
+    long-lived pipe. Requests are sent one at a time, so a large blob can never
+    fill both pipes and deadlock. If git can't be started, the pipe breaks or
+    a request takes longer than ``request_timeout`` seconds, reads fall back
+    to ``git show``.
+
+    When pygit2 is installed (it is optional and not in requirements.txt), objects
+    are read in-process through libgit2 instead and no git process is started
+    at all. Only a definite "not found" is answered by libgit2 alone; anything
+    else it can't handle goes to git. A pygit2 repository must not be shared
+    across threads, so use one reader per thread.
+
+    An optional ``cache`` dict memoizes reads by (ref, path) and may be shared
+    between readers (e.g. one per thread). Only pass one when the refs are
+    commit SHAs, since a branch name can move between reads.
+
+    Usage:
+        with GitBlobReader(project_dir) as blobs:
+            content = blobs.read_decoded("main", "src/app.py")
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        cache: dict[tuple[str, str], bytes | None] | None = None,
+        request_timeout: float = 60,
+    ):
+        self.project_dir = project_dir
+        self.request_timeout = request_timeout
+        self._cache = cache
+        self._proc: subprocess.Popen | None = None
+        self._broken = False
+        self._repo = None
+        self._repo_broken = pygit2 is None
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _repository(self):
+        if self._repo is None and not self._repo_broken:
+            try:
+                self._repo = pygit2.Repository(str(self.project_dir))
+            except Exception:
+                # Not a repository libgit2 can read, such as one with an
+                # unsupported extension - use the git process instead
+                self._repo_broken = True
+        return self._repo
+
+    def _process(self) -> subprocess.Popen | None:
+        if self._proc is None and not self._broken:
+            env = get_isolated_git_env()
+            env.update(_GIT_QUERY_ENV_OVERRIDES)
+            try:
+                self._proc = subprocess.Popen(
+                    [get_git_executable(), "cat-file", "--batch"],
+                    cwd=self.project_dir,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                )
+            except OSError:
+                self._broken = True
+        return self._proc
+
+    def _request(self, ref: str, file_path: str) -> bytes | None:
+        proc = self._process()
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            raise OSError("git cat-file is not available")
+
+        # A wedged git (lock contention, a hung filter) would block the reads
+        # below forever. Killing it closes its end of the pipe, which unblocks
+        # them; the short read then raises and the caller falls back.
+        watchdog = threading.Timer(self.request_timeout, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            proc.stdin.write(f"{ref}:{file_path}\n".encode())
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                raise OSError("git cat-file exited unexpectedly")
+
+            # "<sha> <type> <size>" on success, "<object> missing" (or
+            # "ambiguous") otherwise
+            parts = header.split()
+            if len(parts) != 3 or not parts[2].isdigit():
+                return None
+            size = int(parts[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # Trailing newline after the content
+        finally:
+            watchdog.cancel()
+        if len(data) != size:
+            raise OSError("git cat-file returned a truncated object")
+        if parts[1] != b"blob":
+            # git show pretty-prints trees/tags; leave those to it
+            raise ValueError(f"{ref}:{file_path} is a {parts[1].decode()}")
+        return data
+
+    def read_bytes(self, ref: str, file_path: str) -> bytes | None:
+        """Get raw file content at a ref, or None if it doesn't exist there."""
+        if self._cache is None:
+            return self._read_bytes(ref, file_path)
+        key = (ref, file_path)
+        if key not in self._cache:
+            self._cache[key] = self._read_bytes(ref, file_path)
+        return self._cache[key]
+
+    def _read_bytes(self, ref: str, file_path: str) -> bytes | None:
+        repo = self._repository()
+        if repo is not None:
+            try:
+                obj = repo.revparse_single(f"{ref}:{file_path}")
+            except KeyError:
+                return None  # Unknown ref or path, like cat-file's "missing"
+            except ValueError:
+                pass  # Spec libgit2 rejects - let git decide what it means
+            except pygit2.GitError:
+                self._repo_broken = True
+                self._repo = None
+            else:
+                if isinstance(obj, pygit2.Blob):
+                    return obj.data
+                # git show pretty-prints trees/tags; leave those to it
+                return self._show(ref, file_path)
+
+        # Batch input is newline-delimited, so such paths need git show
+        if not self._broken and "\n" not in file_path and "\n" not in ref:
+            try:
+                return self._request(ref, file_path)
+            except ValueError:
+                pass
+            except OSError:
+                self._broken = True
+                self.close()
+        return self._show(ref, file_path)
+
+    def _show(self, ref: str, file_path: str) -> bytes | None:
+        return _git_query(self.project_dir, ["show", f"{ref}:{file_path}"])
+
+    def read_decoded(self, ref: str, file_path: str) -> str | None:
+        """Get decoded file content at a ref, decoded like run_git() output."""
+        data = self.read_bytes(ref, file_path)
+        return None if data is None else _decode_git_text(data)
+
+    def close(self) -> None:
+        """Stop the git process (it exits on stdin EOF)."""
+        if self._repo is not None:
+            self._repo.free()
+            self._repo = None
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
@@ -20,13 +20,13 @@ def normalize_subtask_aliases(subtask: dict[str, Any]) -> tuple[dict[str, Any],
     normalized = dict(subtask)
     changed = False
 
+    # A missing key and an explicit null both read back as None, so a single
+    # get() per field covers the "not in" check as well.
     id_value = normalized.get("id")
-    id_missing = (
-        "id" not in normalized
-        or id_value is None
-        or (isinstance(id_value, str) and not id_value.strip())
+    id_missing = id_value is None or (
+        isinstance(id_value, str) and not id_value.strip()
     )
-    if id_missing and "subtask_id" in normalized:
+    if id_missing:
         subtask_id = normalized.get("subtask_id")
         if subtask_id is not None:
             subtask_id_str = str(subtask_id).strip()
@@ -35,14 +35,12 @@ def normalize_subtask_aliases(subtask: dict[str, Any]) -> tuple[dict[str, Any],
                 changed = True
 
     description_value = normalized.get("description")
-    description_missing = (
-        "description" not in normalized
-        or description_value is None
-        or (isinstance(description_value, str) and not description_value.strip())
+    description_missing = description_value is None or (
+        isinstance(description_value, str) and not description_value.strip()
     )
-    title = normalized.get("title")
-    if description_missing and isinstance(title, str):
-        title_str = title.strip()
+    if description_missing:
+        title = normalized.get("title")
+        title_str = title.strip() if isinstance(title, str) else ""
         if title_str:
             normalized["description"] = title_str
             changed = True
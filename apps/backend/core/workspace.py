@@ -17,7 +17,12 @@ This module has been refactored for better maintainability:
 Public API is exported via workspace/__init__.py for backward compatibility.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.git_blobs import GitBlobReader, _decode_git_text
 
 # Import git command helper for centralized logging and allowlist compliance
 from core.git_executable import run_git
@@ -81,13 +86,20 @@ from core.workspace.display import (
     show_build_summary,
 )
 from core.workspace.git_utils import (
+    MAX_FILE_LINES_FOR_AI,
     MAX_PARALLEL_AI_MERGES,
     _is_auto_claude_file,
+    _read_head_sha,
+    get_blob_ids,
     get_existing_build_worktree,
+    get_spec_paths,
 )
 from core.workspace.git_utils import (
     apply_path_mapping as _apply_path_mapping,
 )
+from core.workspace.git_utils import (
+    create_conflict_file_with_git as _create_conflict_file_with_git,
+)
 from core.workspace.git_utils import (
     detect_file_renames as _detect_file_renames,
 )
@@ -97,15 +109,15 @@ from core.workspace.git_utils import (
 from core.workspace.git_utils import (
     get_changed_files_from_branch as _get_changed_files_from_branch,
 )
-from core.workspace.git_utils import (
-    get_file_content_from_ref as _get_file_content_from_ref,
-)
 from core.workspace.git_utils import (
     is_binary_file as _is_binary_file,
 )
 from core.workspace.git_utils import (
     is_lock_file as _is_lock_file,
 )
+from core.workspace.git_utils import (
+    repair_python_syntax as _repair_python_syntax,
+)
 from core.workspace.git_utils import (
     validate_merged_syntax as _validate_merged_syntax,
 )
@@ -117,13 +129,77 @@ from core.workspace.models import (
     ParallelMergeResult,
     ParallelMergeTask,
 )
-from merge import (
-    FileTimelineTracker,
-    MergeOrchestrator,
-)
+
+# The merge package pulls in the AI resolver stack; it is imported lazily at
+# merge time so review/discard/help paths don't pay for it.
+if TYPE_CHECKING:
+    from merge import FileTimelineTracker, MergeOrchestrator
 
 MODULE = "workspace"
 
+# Timeline tracker and orchestrator per project, reused across merges in one
+# process (UI sessions merge repeatedly). Both load state from .auto-claude/
+# on construction, so an entry is dropped once the project's HEAD moves -
+# every merge commit, and every main-branch commit the timeline hook records.
+_MERGE_COMPONENTS: dict[
+    str, tuple[str | None, "FileTimelineTracker", "MergeOrchestrator"]
+] = {}
+_MERGE_COMPONENTS_LOCK = threading.Lock()
+
+
+def _get_merge_components(
+    project_dir: Path,
+) -> tuple["FileTimelineTracker | None", "MergeOrchestrator"]:
+    """
+    Get a cached (FileTimelineTracker, MergeOrchestrator) for a project.
+
+    The tracker is None if it could not be loaded; such results aren't cached.
+    """
+    from merge import FileTimelineTracker, MergeOrchestrator
+
+    key = str(project_dir)
+    head_sha = _read_head_sha(project_dir)
+    with _MERGE_COMPONENTS_LOCK:
+        cached = _MERGE_COMPONENTS.get(key)
+        if cached is not None and cached[0] == head_sha:
+            return cached[1], cached[2]
+
+    debug(
+        MODULE,
+        "Initializing MergeOrchestrator",
+        project_dir=str(project_dir),
+        enable_ai=True,
+    )
+    try:
+        timeline_tracker: FileTimelineTracker | None = FileTimelineTracker(project_dir)
+    except Exception as e:
+        debug_warning(MODULE, f"Could not load timeline tracker: {e}")
+        timeline_tracker = None
+    orchestrator = MergeOrchestrator(
+        project_dir,
+        enable_ai=True,  # Enable AI for ambiguous conflicts
+        dry_run=False,
+    )
+    if timeline_tracker is not None:
+        with _MERGE_COMPONENTS_LOCK:
+            _MERGE_COMPONENTS[key] = (head_sha, timeline_tracker, orchestrator)
+    return timeline_tracker, orchestrator
+
+
+def invalidate_merge_components(project_dir: Path | None = None) -> None:
+    """
+    Drop cached merge components.
+
+    Args:
+        project_dir: Specific project to invalidate, or None to clear all
+    """
+    with _MERGE_COMPONENTS_LOCK:
+        if project_dir is None:
+            _MERGE_COMPONENTS.clear()
+        else:
+            _MERGE_COMPONENTS.pop(str(project_dir), None)
+
+
 # The following functions are now imported from refactored modules above.
 # They are kept here only to avoid breaking the existing code that still needs
 # the complex merge operations below.
@@ -197,7 +273,7 @@ def merge_existing_build(
         else None
     )
 
-    spec_branch = f"auto-claude/{spec_name}"
+    spec_branch = get_spec_paths(project_dir, spec_name).branch
 
     # Don't merge a branch into itself
     if current_branch == spec_branch:
@@ -405,26 +481,15 @@ def _try_smart_merge_inner(
     try:
         print(muted("  Analyzing changes with intent-aware merge..."))
 
-        # Capture worktree state in FileTimelineTracker before merge
-        try:
-            timeline_tracker = FileTimelineTracker(project_dir)
-            timeline_tracker.capture_worktree_state(spec_name, worktree_path)
-            debug(MODULE, "Captured worktree state for timeline tracking")
-        except Exception as e:
-            debug_warning(MODULE, f"Could not capture worktree state: {e}")
+        timeline_tracker, orchestrator = _get_merge_components(project_dir)
 
-        # Initialize the orchestrator
-        debug(
-            MODULE,
-            "Initializing MergeOrchestrator",
-            project_dir=str(project_dir),
-            enable_ai=True,
-        )
-        orchestrator = MergeOrchestrator(
-            project_dir,
-            enable_ai=True,  # Enable AI for ambiguous conflicts
-            dry_run=False,
-        )
+        # Capture worktree state in FileTimelineTracker before merge
+        if timeline_tracker is not None:
+            try:
+                timeline_tracker.capture_worktree_state(spec_name, worktree_path)
+                debug(MODULE, "Captured worktree state for timeline tracking")
+            except Exception as e:
+                debug_warning(MODULE, f"Could not capture worktree state: {e}")
 
         # Refresh evolution data from the worktree
         # Use task_source_branch (where task branched from) for comparing what files changed
@@ -562,7 +627,7 @@ def _try_smart_merge_inner(
             print(muted("  Copying changed files directly from worktree..."))
 
             # Get changed files from spec branch
-            spec_branch = f"auto-claude/{spec_name}"
+            spec_branch = get_spec_paths(project_dir, spec_name).branch
             base_branch = git_conflicts.get("base_branch", "main")
 
             # Get merge-base for diff
@@ -603,46 +668,25 @@ def _try_smart_merge_inner(
                             # New or modified - copy from spec branch
                             target_path.parent.mkdir(parents=True, exist_ok=True)
 
-                            if _is_binary_file(file_path):
-                                binary_content = _get_binary_file_content_from_ref(
-                                    project_dir, spec_branch, file_path
+                            # Copied as raw bytes (text too) - no decode/encode
+                            # round trip for content that is written unchanged
+                            content = _get_binary_file_content_from_ref(
+                                project_dir, spec_branch, file_path
+                            )
+                            if content is not None:
+                                target_path.write_bytes(content)
+                                files_to_stage.append(file_path)
+                                resolved_files.append(file_path)
+                                status_label = (
+                                    "new file" if status == "A" else "updated"
                                 )
-                                if binary_content is not None:
-                                    target_path.write_bytes(binary_content)
-                                    files_to_stage.append(file_path)
-                                    resolved_files.append(file_path)
-                                    status_label = (
-                                        "new file" if status == "A" else "updated"
-                                    )
-                                    print(
-                                        success(f"    ✓ {file_path} ({status_label})")
-                                    )
-                                else:
-                                    skipped_files.append(file_path)
-                                    debug_warning(
-                                        MODULE,
-                                        f"Could not retrieve binary content for {file_path}",
-                                    )
+                                print(success(f"    ✓ {file_path} ({status_label})"))
                             else:
-                                content = _get_file_content_from_ref(
-                                    project_dir, spec_branch, file_path
+                                skipped_files.append(file_path)
+                                debug_warning(
+                                    MODULE,
+                                    f"Could not retrieve content for {file_path}",
                                 )
-                                if content is not None:
-                                    target_path.write_text(content, encoding="utf-8")
-                                    files_to_stage.append(file_path)
-                                    resolved_files.append(file_path)
-                                    status_label = (
-                                        "new file" if status == "A" else "updated"
-                                    )
-                                    print(
-                                        success(f"    ✓ {file_path} ({status_label})")
-                                    )
-                                else:
-                                    skipped_files.append(file_path)
-                                    debug_warning(
-                                        MODULE,
-                                        f"Could not retrieve content for {file_path}",
-                                    )
 
                     except Exception as e:
                         skipped_files.append(file_path)
@@ -766,7 +810,7 @@ def _rebase_spec_branch(
         True if rebase succeeded cleanly or branch was already up-to-date,
         False if rebase failed due to conflicts or other errors (aborted, no ref movement)
     """
-    spec_branch = f"auto-claude/{spec_name}"
+    spec_branch = get_spec_paths(project_dir, spec_name).branch
 
     debug(
         MODULE,
@@ -928,9 +972,7 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     Returns:
         Dict with has_conflicts, conflicting_files, etc.
     """
-    import re
-
-    spec_branch = f"auto-claude/{spec_name}"
+    spec_branch = get_spec_paths(project_dir, spec_name).branch
     result = {
         "has_conflicts": False,
         "conflicting_files": [],
@@ -941,43 +983,38 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     }
 
     try:
-        # Get current branch
-        base_result = run_git(
-            ["rev-parse", "--abbrev-ref", "HEAD"],
+        # Resolve HEAD, the spec branch and the current branch name in one
+        # process. --abbrev-ref applies to every argument after it, so it
+        # comes last.
+        rev_parse_result = run_git(
+            ["rev-parse", "HEAD", spec_branch, "--abbrev-ref", "HEAD"],
             cwd=project_dir,
         )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
+        rev_parse_lines = rev_parse_result.stdout.split()
+        if rev_parse_result.returncode != 0 or len(rev_parse_lines) != 3:
+            # Keep reporting the current branch even when the spec branch
+            # can't be resolved
+            base_result = run_git(
+                ["rev-parse", "--abbrev-ref", "HEAD"],
+                cwd=project_dir,
+            )
+            if base_result.returncode == 0:
+                result["base_branch"] = base_result.stdout.strip()
+            debug_warning(MODULE, "Could not resolve branch commits")
+            return result
+
+        main_commit, spec_commit, result["base_branch"] = rev_parse_lines
 
         # Get merge base
         merge_base_result = run_git(
-            ["merge-base", result["base_branch"], spec_branch],
+            ["merge-base", main_commit, spec_commit],
             cwd=project_dir,
         )
         if merge_base_result.returncode != 0:
             debug_warning(MODULE, "Could not find merge base")
             return result
-
-        _merge_base = (
-            merge_base_result.stdout.strip()
-        )  # Reserved for future conflict detection
-
-        # Get commit hashes
-        main_commit_result = run_git(
-            ["rev-parse", result["base_branch"]],
-            cwd=project_dir,
-        )
-        spec_commit_result = run_git(
-            ["rev-parse", spec_branch],
-            cwd=project_dir,
-        )
-
-        if main_commit_result.returncode != 0 or spec_commit_result.returncode != 0:
-            debug_warning(MODULE, "Could not resolve branch commits")
-            return result
-
-        main_commit = main_commit_result.stdout.strip()
-        spec_commit = spec_commit_result.stdout.strip()
+        # Passed on so conflict resolution doesn't have to compute it again
+        result["merge_base"] = merge_base_result.stdout.strip()
 
         # Check if spec branch is behind base branch (needs rebase)
         # Count commits that are in base branch but not in spec branch
@@ -1021,6 +1058,8 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
                 "merge-tree",
                 "--write-tree",
                 "--no-messages",
+                "--name-only",
+                "-z",
                 result["base_branch"],  # Use branch names, not commit hashes
                 spec_branch,
             ],
@@ -1030,26 +1069,17 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
         # merge-tree returns exit code 1 if there are actual text conflicts
         # Exit code 0 means clean merge possible
         if merge_tree_result.returncode != 0:
-            # Parse the output for ACTUAL conflicting files (look for CONFLICT markers)
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                if "CONFLICT" in line:
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Only set has_conflicts if we found ACTUAL CONFLICT markers
-            # A non-zero exit code without CONFLICT markers just means branches diverged
+            # With -z --name-only the output is the merged tree OID followed by
+            # each conflicted path once, all NUL-terminated
+            for file_path in merge_tree_result.stdout.split("\0")[1:]:
+                if not file_path:
+                    break
+                # Skip .auto-claude files - they should never be merged
+                if not _is_auto_claude_file(file_path):
+                    result["conflicting_files"].append(file_path)
+
+            # Only set has_conflicts if merge-tree listed conflicted paths
+            # A non-zero exit code without them just means branches diverged
             # but git can auto-merge them - we handle this with direct file copy
             if result["conflicting_files"]:
                 result["has_conflicts"] = True
@@ -1059,12 +1089,12 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
                     files=result["conflicting_files"],
                 )
             else:
-                # No CONFLICT markers = no actual conflicts
+                # No conflicted paths = no actual conflicts
                 # Branches diverged but changes don't overlap - git can auto-merge
                 # We'll handle this by copying files directly from spec branch
                 debug(
                     MODULE,
-                    "No CONFLICT markers - branches diverged but can be auto-merged",
+                    "No conflicted paths - branches diverged but can be auto-merged",
                     merge_tree_returncode=merge_tree_result.returncode,
                 )
                 result["has_conflicts"] = False
@@ -1076,12 +1106,129 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     return result
 
 
+def _stage_files(project_dir: Path, file_paths: list[str]) -> list[str]:
+    """
+    Stage files (including deletions) with a single git add.
+
+    git add stages nothing if any one pathspec fails to match (e.g. a deleted
+    file git never tracked), so on failure each file is added on its own.
+
+    Returns:
+        The paths that could not be staged
+    """
+    if not file_paths:
+        return []
+    # Paths go over stdin, so the list can't exceed the command-line limit
+    add_result = run_git(
+        ["add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        cwd=project_dir,
+        input_data="\0".join(file_paths),
+    )
+    if add_result.returncode == 0:
+        return []
+
+    debug_warning(
+        MODULE,
+        "Batched git add failed, staging files one by one",
+        stderr=add_result.stderr,
+    )
+    failed = []
+    for file_path in file_paths:
+        # "--" so a path starting with "-" isn't taken for an option
+        if run_git(["add", "--", file_path], cwd=project_dir).returncode != 0:
+            failed.append(file_path)
+    return failed
+
+
+def _categorize_conflicting_file(
+    blobs: GitBlobReader,
+    file_path: str,
+    target_file_path: str,
+    base_ref: str,
+    spec_ref: str,
+    merge_base: str | None,
+    spec_status: str | None = None,
+) -> tuple[str, object]:
+    """
+    Decide how a git-conflicting file should be resolved.
+
+    Only reads from git, so it is safe to run for several files at once as
+    long as each thread passes its own GitBlobReader.
+
+    spec_status is the file's --name-status letter on the spec branch since
+    the merge-base, if known. A spec-side deletion is then settled without
+    reading the worktree or merge-base content.
+
+    Returns:
+        (kind, payload) where kind is one of:
+        - "missing": file exists on neither branch (payload None)
+        - "new": only on the spec branch (payload is the worktree bytes)
+        - "deleted": removed on the spec branch (payload None)
+        - "lock": lock file, keep main's version (payload is the main bytes)
+        - "binary": binary file on both branches, needs review (payload is
+          the worktree bytes)
+        - "auto": simple 3-way merge succeeded (payload is the merged content)
+        - "too_large": too big to send to AI, needs review (payload is the
+          worktree bytes)
+        - "ai": needs an AI merge (payload is (main, worktree, base) content)
+    """
+    if spec_status == "D":
+        # Deleted in the worktree - only main's side is left to check
+        if blobs.read_bytes(base_ref, target_file_path) is None:
+            return "missing", None
+        return "deleted", None
+
+    # Get content from main branch using MAPPED path (file may have been renamed)
+    main_bytes = blobs.read_bytes(base_ref, target_file_path)
+
+    # Get content from worktree branch using ORIGINAL path
+    worktree_bytes = blobs.read_bytes(spec_ref, file_path)
+
+    # Whole-file outcomes are written back as the raw bytes; only content
+    # that gets merged is decoded
+    if main_bytes is None and worktree_bytes is None:
+        return "missing", None
+    if main_bytes is None:
+        return "new", worktree_bytes
+    if worktree_bytes is None:
+        return "deleted", None
+    if _is_lock_file(target_file_path):
+        return "lock", main_bytes
+    if _is_binary_file(file_path, worktree_bytes) or _is_binary_file(
+        file_path, main_bytes
+    ):
+        # Changed on both branches and can't be merged textually (checks the
+        # extension, then the content) - don't decode or fetch the base
+        return "binary", worktree_bytes
+
+    main_content = _decode_git_text(main_bytes)
+    worktree_content = _decode_git_text(worktree_bytes)
+
+    # Get content from merge-base (common ancestor) using ORIGINAL path
+    base_content = None
+    if merge_base:
+        base_content = blobs.read_decoded(merge_base, file_path)
+
+    # File exists in both - try simple 3-way merge FIRST (no AI needed)
+    # This handles cases where:
+    # - Only one side changed from base (ours==base or theirs==base)
+    # - Both sides made identical changes (ours==theirs)
+    simple_success, simple_merged = _try_simple_3way_merge(
+        base_content, main_content, worktree_content
+    )
+    if simple_success and simple_merged is not None:
+        return "auto", simple_merged
+    if worktree_content.count("\n") > MAX_FILE_LINES_FOR_AI:
+        return "too_large", worktree_bytes
+    return "ai", (main_content, worktree_content, base_content)
+
+
 def _resolve_git_conflicts_with_ai(
     project_dir: Path,
     spec_name: str,
     worktree_path: Path,
     git_conflicts: dict,
-    orchestrator: MergeOrchestrator,
+    orchestrator: "MergeOrchestrator",
     no_commit: bool = False,
 ) -> dict:
     """
@@ -1108,7 +1255,9 @@ def _resolve_git_conflicts_with_ai(
 
     conflicting_files = git_conflicts.get("conflicting_files", [])
     base_branch = git_conflicts.get("base_branch", "main")
-    spec_branch = git_conflicts.get("spec_branch", f"auto-claude/{spec_name}")
+    spec_branch = git_conflicts.get(
+        "spec_branch", get_spec_paths(project_dir, spec_name).branch
+    )
 
     debug_detailed(
         MODULE,
@@ -1119,6 +1268,7 @@ def _resolve_git_conflicts_with_ai(
     )
 
     resolved_files = []
+    files_to_stage: list[str] = []  # Staged together once everything is written
     remaining_conflicts = []
     auto_merged_count = 0
     ai_merged_count = 0
@@ -1128,14 +1278,18 @@ def _resolve_git_conflicts_with_ai(
         f"Resolving {len(conflicting_files)} conflicting file(s) with AI...", "progress"
     )
 
-    # Get merge-base commit
-    merge_base_result = run_git(
-        ["merge-base", base_branch, spec_branch],
-        cwd=project_dir,
-    )
-    merge_base = (
-        merge_base_result.stdout.strip() if merge_base_result.returncode == 0 else None
-    )
+    # Get merge-base commit (_check_git_conflicts usually found it already)
+    merge_base = git_conflicts.get("merge_base")
+    if not merge_base:
+        merge_base_result = run_git(
+            ["merge-base", base_branch, spec_branch],
+            cwd=project_dir,
+        )
+        merge_base = (
+            merge_base_result.stdout.strip()
+            if merge_base_result.returncode == 0
+            else None
+        )
     debug(
         MODULE,
         "Found merge-base commit",
@@ -1159,6 +1313,27 @@ def _resolve_git_conflicts_with_ai(
                 )
             )
 
+    # Many resolved files share directories; create each one only once
+    ensured_dirs: set[Path] = set()
+
+    def _ensure_parent_dir(target_path: Path) -> None:
+        parent = target_path.parent
+        if parent not in ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            ensured_dirs.add(parent)
+
+    # One git cat-file process serves every file read below instead of a
+    # git show fork per (ref, path). Reads go through commit SHAs so they can
+    # be memoized for the rest of this merge even if a branch moves meanwhile.
+    blob_cache: dict[tuple[str, str], bytes | None] | None = None
+    base_ref, spec_ref = base_branch, spec_branch
+    refs_result = run_git(["rev-parse", base_branch, spec_branch], cwd=project_dir)
+    ref_shas = refs_result.stdout.split()
+    if refs_result.returncode == 0 and len(ref_shas) == 2:
+        base_ref, spec_ref = ref_shas
+        blob_cache = {}
+    blobs = GitBlobReader(project_dir, cache=blob_cache)
+
     # FIX: Copy NEW files FIRST before resolving conflicts
     # This ensures dependencies exist before files that import them are written
     changed_files = _get_changed_files_from_branch(
@@ -1175,154 +1350,194 @@ def _resolve_git_conflicts_with_ai(
                 # Apply path mapping - write to new location if file was renamed
                 target_file_path = _apply_path_mapping(file_path, path_mappings)
                 target_path = project_dir / target_file_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Handle binary files differently - use bytes instead of text
-                if _is_binary_file(file_path):
-                    binary_content = _get_binary_file_content_from_ref(
-                        project_dir, spec_branch, file_path
-                    )
-                    if binary_content is not None:
-                        target_path.write_bytes(binary_content)
-                        run_git(["add", target_file_path], cwd=project_dir)
-                        resolved_files.append(target_file_path)
-                        debug(MODULE, f"Copied new binary file: {file_path}")
-                else:
-                    content = _get_file_content_from_ref(
-                        project_dir, spec_branch, file_path
-                    )
-                    if content is not None:
-                        target_path.write_text(content, encoding="utf-8")
-                        run_git(["add", target_file_path], cwd=project_dir)
-                        resolved_files.append(target_file_path)
-                        if target_file_path != file_path:
-                            debug(
-                                MODULE,
-                                f"Copied new file with path mapping: {file_path} -> {target_file_path}",
-                            )
-                        else:
-                            debug(MODULE, f"Copied new file: {file_path}")
+                _ensure_parent_dir(target_path)
+
+                # New files are copied unchanged, so keep them as raw bytes
+                # (binary or not) rather than decoding and re-encoding
+                content = blobs.read_bytes(spec_ref, file_path)
+                if content is not None:
+                    target_path.write_bytes(content)
+                    files_to_stage.append(target_file_path)
+                    resolved_files.append(target_file_path)
+                    if target_file_path != file_path:
+                        debug(
+                            MODULE,
+                            f"Copied new file with path mapping: {file_path} -> {target_file_path}",
+                        )
+                    else:
+                        debug(MODULE, f"Copied new file: {file_path}")
             except Exception as e:
                 debug_warning(MODULE, f"Could not copy new file {file_path}: {e}")
 
     # Categorize conflicting files for processing
     files_needing_ai_merge: list[ParallelMergeTask] = []
     simple_merges: list[
-        tuple[str, str | None]
+        tuple[str, str | bytes | None]
     ] = []  # (file_path, merged_content or None for delete)
     lock_files_excluded: list[str] = []  # Lock files excluded from merge
     auto_merged_simple: set[str] = set()  # Files that were auto-merged via simple 3-way
+    # Both-sides conflicts that can't be merged here (binary, too large):
+    # (path, worktree bytes, reason). The worktree version is written for
+    # review but not staged, and the file is reported as a remaining conflict.
+    needs_review: list[tuple[str, bytes, str]] = []
 
     debug(MODULE, "Categorizing conflicting files for parallel processing")
 
-    for file_path in conflicting_files:
-        # Apply path mapping to get the target path in the current branch
+    # Files whose blob is the same on both branches need no merge at all (and
+    # the working tree already has that content). One cat-file call compares
+    # the object IDs for every file.
+    target_paths = [_apply_path_mapping(f, path_mappings) for f in conflicting_files]
+    blob_ids = get_blob_ids(
+        project_dir,
+        [
+            pair
+            for file_path, target_file_path in zip(conflicting_files, target_paths)
+            for pair in ((base_ref, target_file_path), (spec_ref, file_path))
+        ],
+    )
+    to_categorize: list[str] = []
+    for file_path, target_file_path, main_id, spec_id in zip(
+        conflicting_files, target_paths, blob_ids[0::2], blob_ids[1::2]
+    ):
+        if main_id is None or main_id != spec_id:
+            to_categorize.append(file_path)
+            continue
+        resolved_files.append(target_file_path)
+        auto_merged_count += 1
+        print(success(f"    ✓ {target_file_path} (identical on both branches)"))
+        debug(MODULE, f"  {file_path}: identical on both branches (no merge needed)")
+
+    # The spec branch's own diff (fetched above for the new-file copy) tells us
+    # which conflicting files the worktree deleted
+    spec_statuses = dict(changed_files)
+
+    # Categorization only reads from git, so files are categorized on a thread
+    # pool. GitBlobReader isn't thread-safe: each worker thread gets its own
+    # reader, and the main thread (used when there's a single file) reuses ours.
+    thread_blobs = threading.local()
+    thread_blobs.reader = blobs
+    worker_blobs: list[GitBlobReader] = []
+
+    def _categorize(file_path: str) -> tuple[str, str, object]:
         target_file_path = _apply_path_mapping(file_path, path_mappings)
+        reader = getattr(thread_blobs, "reader", None)
+        if reader is None:
+            reader = thread_blobs.reader = GitBlobReader(project_dir, cache=blob_cache)
+            worker_blobs.append(reader)
+        try:
+            kind, payload = _categorize_conflicting_file(
+                reader,
+                file_path,
+                target_file_path,
+                base_ref,
+                spec_ref,
+                merge_base,
+                spec_statuses.get(file_path),
+            )
+        except Exception as e:
+            return target_file_path, "error", e
+        return target_file_path, kind, payload
+
+    if len(to_categorize) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_categorize))) as executor:
+            categorized = list(executor.map(_categorize, to_categorize))
+        for reader in worker_blobs:
+            reader.close()
+    else:
+        categorized = [_categorize(file_path) for file_path in to_categorize]
+
+    for file_path, (target_file_path, kind, payload) in zip(to_categorize, categorized):
         debug(
             MODULE,
             f"Categorizing conflicting file: {file_path}"
             + (f" -> {target_file_path}" if target_file_path != file_path else ""),
         )
+        mapped_note = (
+            f" (will write to {target_file_path})"
+            if target_file_path != file_path
+            else ""
+        )
 
-        try:
-            # Get content from main branch using MAPPED path (file may have been renamed)
-            main_content = _get_file_content_from_ref(
-                project_dir, base_branch, target_file_path
-            )
-
-            # Get content from worktree branch using ORIGINAL path
-            worktree_content = _get_file_content_from_ref(
-                project_dir, spec_branch, file_path
-            )
-
-            # Get content from merge-base (common ancestor) using ORIGINAL path
-            base_content = None
-            if merge_base:
-                base_content = _get_file_content_from_ref(
-                    project_dir, merge_base, file_path
-                )
-
-            if main_content is None and worktree_content is None:
-                # File doesn't exist in either - skip
-                continue
-
-            if main_content is None:
-                # File only exists in worktree - it's a new file (no AI needed)
-                # Write to target path (mapped if applicable)
-                simple_merges.append((target_file_path, worktree_content))
-                debug(MODULE, f"  {file_path}: new file (no AI needed)")
-            elif worktree_content is None:
-                # File only exists in main - was deleted in worktree (no AI needed)
-                simple_merges.append((target_file_path, None))  # None = delete
-                debug(MODULE, f"  {file_path}: deleted (no AI needed)")
-            else:
-                # File exists in both - check if it's a lock file
-                if _is_lock_file(target_file_path):
-                    # Lock files should be excluded from merge entirely
-                    # They must be regenerated after merge by running the package manager
-                    # (e.g., npm install, pnpm install, uv sync, cargo update)
-                    #
-                    # Strategy: Take main branch version and let user regenerate
-                    lock_files_excluded.append(target_file_path)
-                    simple_merges.append((target_file_path, main_content))
-                    debug(
-                        MODULE,
-                        f"  {target_file_path}: lock file (excluded - will use main version)",
-                    )
-                else:
-                    # File exists in both - try simple 3-way merge FIRST (no AI needed)
-                    # This handles cases where:
-                    # - Only one side changed from base (ours==base or theirs==base)
-                    # - Both sides made identical changes (ours==theirs)
-                    simple_success, simple_merged = _try_simple_3way_merge(
-                        base_content, main_content, worktree_content
-                    )
-
-                    if simple_success and simple_merged is not None:
-                        # Simple 3-way merge succeeded - no AI needed!
-                        simple_merges.append((target_file_path, simple_merged))
-                        auto_merged_simple.add(target_file_path)  # Track for stats
-                        debug(
-                            MODULE,
-                            f"  {file_path}: auto-merged (simple 3-way, no AI needed)"
-                            + (
-                                f" (will write to {target_file_path})"
-                                if target_file_path != file_path
-                                else ""
-                            ),
-                        )
-                    else:
-                        # Simple merge failed - needs AI merge
-                        # Store the TARGET path for writing, but track original for content retrieval
-                        files_needing_ai_merge.append(
-                            ParallelMergeTask(
-                                file_path=target_file_path,  # Use target path for writing
-                                main_content=main_content,
-                                worktree_content=worktree_content,
-                                base_content=base_content,
-                                spec_name=spec_name,
-                                project_dir=project_dir,
-                            )
-                        )
-                        debug(
-                            MODULE,
-                            f"  {file_path}: needs AI merge (both sides changed differently)"
-                            + (
-                                f" (will write to {target_file_path})"
-                                if target_file_path != file_path
-                                else ""
-                            ),
-                        )
-
-        except Exception as e:
-            print(error(f"    ✗ Failed to categorize {file_path}: {e}"))
+        if kind == "missing":
+            # File doesn't exist in either - skip
+            continue
+        if kind == "error":
+            print(error(f"    ✗ Failed to categorize {file_path}: {payload}"))
             remaining_conflicts.append(
                 {
                     "file": file_path,
-                    "reason": str(e),
+                    "reason": str(payload),
                     "severity": "high",
                 }
             )
+        elif kind == "new":
+            # File only exists in worktree - it's a new file (no AI needed)
+            # Write to target path (mapped if applicable)
+            simple_merges.append((target_file_path, payload))
+            debug(MODULE, f"  {file_path}: new file (no AI needed)")
+        elif kind == "deleted":
+            # File only exists in main - was deleted in worktree (no AI needed)
+            simple_merges.append((target_file_path, None))  # None = delete
+            debug(MODULE, f"  {file_path}: deleted (no AI needed)")
+        elif kind == "lock":
+            # Lock files should be excluded from merge entirely
+            # They must be regenerated after merge by running the package manager
+            # (e.g., npm install, pnpm install, uv sync, cargo update)
+            #
+            # Strategy: Take main branch version and let user regenerate
+            lock_files_excluded.append(target_file_path)
+            simple_merges.append((target_file_path, payload))
+            debug(
+                MODULE,
+                f"  {target_file_path}: lock file (excluded - will use main version)",
+            )
+        elif kind == "binary":
+            # Binary files can't be merged textually - main's side needs review
+            needs_review.append(
+                (target_file_path, payload, "binary file changed on both branches")
+            )
+            debug(MODULE, f"  {file_path}: binary (needs manual review)")
+        elif kind == "too_large":
+            # Too large for an AI merge - main's side needs review
+            needs_review.append(
+                (
+                    target_file_path,
+                    payload,
+                    f"over {MAX_FILE_LINES_FOR_AI} lines, too large for AI merge",
+                )
+            )
+            debug_warning(
+                MODULE,
+                f"  {file_path}: too large for AI merge (needs manual review)",
+            )
+        elif kind == "auto":
+            # Simple 3-way merge succeeded - no AI needed!
+            simple_merges.append((target_file_path, payload))
+            auto_merged_simple.add(target_file_path)  # Track for stats
+            debug(
+                MODULE,
+                f"  {file_path}: auto-merged (simple 3-way, no AI needed)"
+                + mapped_note,
+            )
+        else:
+            # Simple merge failed - needs AI merge
+            # Store the TARGET path for writing, but track original for content retrieval
+            main_content, worktree_content, base_content = payload
+            files_needing_ai_merge.append(
+                ParallelMergeTask(
+                    file_path=target_file_path,  # Use target path for writing
+                    main_content=main_content,
+                    worktree_content=worktree_content,
+                    base_content=base_content,
+                    spec_name=spec_name,
+                    project_dir=project_dir,
+                )
+            )
+            debug(
+                MODULE,
+                f"  {file_path}: needs AI merge (both sides changed differently)"
+                + mapped_note,
+            )
 
     # Process simple merges first (fast, no AI)
     if simple_merges:
@@ -1331,9 +1546,12 @@ def _resolve_git_conflicts_with_ai(
             try:
                 if merged_content is not None:
                     target_path = project_dir / file_path
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    target_path.write_text(merged_content, encoding="utf-8")
-                    run_git(["add", file_path], cwd=project_dir)
+                    _ensure_parent_dir(target_path)
+                    if isinstance(merged_content, bytes):
+                        target_path.write_bytes(merged_content)
+                    else:
+                        target_path.write_text(merged_content, encoding="utf-8")
+                    files_to_stage.append(file_path)
                     resolved_files.append(file_path)
                     # Show appropriate message based on merge type
                     if file_path in auto_merged_simple:
@@ -1352,7 +1570,7 @@ def _resolve_git_conflicts_with_ai(
                     target_path = project_dir / file_path
                     if target_path.exists():
                         target_path.unlink()
-                        run_git(["add", file_path], cwd=project_dir)
+                        files_to_stage.append(file_path)
                     resolved_files.append(file_path)
                     print(success(f"    ✓ {file_path} (deleted)"))
             except Exception as e:
@@ -1365,6 +1583,26 @@ def _resolve_git_conflicts_with_ai(
                     }
                 )
 
+    # Write the worktree version of unmergeable conflicts so there is something
+    # to review, but leave them unstaged - main's side was not merged in
+    for file_path, worktree_bytes, reason in needs_review:
+        try:
+            target_path = project_dir / file_path
+            _ensure_parent_dir(target_path)
+            target_path.write_bytes(worktree_bytes)
+        except OSError as e:
+            reason = f"{reason}; could not write worktree version: {e}"
+        else:
+            reason = f"{reason} (worktree version written, not staged)"
+        print(warning(f"    ⚠ {file_path}: {reason}"))
+        remaining_conflicts.append(
+            {
+                "file": file_path,
+                "reason": reason,
+                "severity": "high",
+            }
+        )
+
     # Process AI merges in parallel
     if files_needing_ai_merge:
         print()
@@ -1392,9 +1630,9 @@ def _resolve_git_conflicts_with_ai(
         for result in parallel_results:
             if result.success:
                 target_path = project_dir / result.file_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_parent_dir(target_path)
                 target_path.write_text(result.merged_content, encoding="utf-8")
-                run_git(["add", result.file_path], cwd=project_dir)
+                files_to_stage.append(result.file_path)
                 resolved_files.append(result.file_path)
 
                 if result.was_auto_merged:
@@ -1446,17 +1684,11 @@ def _resolve_git_conflicts_with_ai(
         if target_file_path != file_path and status != "D":
             # File was renamed/moved - needs AI merge to incorporate changes
             # Get content from worktree (old path) and target branch (new path)
-            worktree_content = _get_file_content_from_ref(
-                project_dir, spec_branch, file_path
-            )
-            target_content = _get_file_content_from_ref(
-                project_dir, base_branch, target_file_path
-            )
+            worktree_content = blobs.read_decoded(spec_ref, file_path)
+            target_content = blobs.read_decoded(base_ref, target_file_path)
             base_content = None
             if merge_base:
-                base_content = _get_file_content_from_ref(
-                    project_dir, merge_base, file_path
-                )
+                base_content = blobs.read_decoded(merge_base, file_path)
 
             if worktree_content and target_content:
                 # Both exist - need AI merge
@@ -1507,9 +1739,9 @@ def _resolve_git_conflicts_with_ai(
         for result in path_mapped_results:
             if result.success:
                 target_path = project_dir / result.file_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_parent_dir(target_path)
                 target_path.write_text(result.merged_content, encoding="utf-8")
-                run_git(["add", result.file_path], cwd=project_dir)
+                files_to_stage.append(result.file_path)
                 resolved_files.append(result.file_path)
 
                 if result.was_auto_merged:
@@ -1538,42 +1770,32 @@ def _resolve_git_conflicts_with_ai(
                 target_path = project_dir / target_file_path
                 if target_path.exists():
                     target_path.unlink()
-                    run_git(["add", target_file_path], cwd=project_dir)
+                    files_to_stage.append(target_file_path)
             else:
-                # Modified without path change - simple copy
-                # Check if binary file to use correct read/write method
+                # Modified without path change - simple copy of the raw bytes
                 target_path = project_dir / target_file_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if _is_binary_file(file_path):
-                    binary_content = _get_binary_file_content_from_ref(
-                        project_dir, spec_branch, file_path
-                    )
-                    if binary_content is not None:
-                        target_path.write_bytes(binary_content)
-                        run_git(["add", target_file_path], cwd=project_dir)
-                        resolved_files.append(target_file_path)
-                        if target_file_path != file_path:
-                            debug(
-                                MODULE,
-                                f"Merged binary with path mapping: {file_path} -> {target_file_path}",
-                            )
-                else:
-                    content = _get_file_content_from_ref(
-                        project_dir, spec_branch, file_path
-                    )
-                    if content is not None:
-                        target_path.write_text(content, encoding="utf-8")
-                        run_git(["add", target_file_path], cwd=project_dir)
-                        resolved_files.append(target_file_path)
-                        if target_file_path != file_path:
-                            debug(
-                                MODULE,
-                                f"Merged with path mapping: {file_path} -> {target_file_path}",
-                            )
+                _ensure_parent_dir(target_path)
+
+                content = blobs.read_bytes(spec_ref, file_path)
+                if content is not None:
+                    target_path.write_bytes(content)
+                    files_to_stage.append(target_file_path)
+                    resolved_files.append(target_file_path)
+                    if target_file_path != file_path:
+                        debug(
+                            MODULE,
+                            f"Merged with path mapping: {file_path} -> {target_file_path}",
+                        )
         except Exception as e:
             print(muted(f"    Warning: Could not process {file_path}: {e}"))
 
+    blobs.close()
+    if blob_cache is not None:
+        blob_cache.clear()
+
+    for file_path in _stage_files(project_dir, files_to_stage):
+        print(warning(f"    ⚠ {file_path}: written but could not be staged"))
+
     # V2: Record merge completion in Evolution Tracker for future context
     # TODO: _record_merge_completion not yet implemented - see line 141
     # if resolved_files:
@@ -1637,8 +1859,12 @@ def _resolve_git_conflicts_with_ai(
 # =============================================================================
 
 import asyncio
+import hashlib
 import logging
 import os
+import time
+
+from core.file_utils import atomic_write
 
 _merge_logger = logging.getLogger(__name__)
 
@@ -1679,6 +1905,12 @@ MERGE_CAPABLE_MODEL = "claude-sonnet-4-5-20250929"  # Capable model for complex
 MERGE_FAST_THINKING = 1024  # Lower thinking for fast/simple merges
 MERGE_COMPLEX_THINKING = 16000  # Higher thinking for complex merges
 
+# Cached AI merges. Bump the version whenever prompt building or merged-output
+# validation changes so merges produced under the old rules are not reused.
+AI_MERGE_CACHE_VERSION = 1
+AI_MERGE_CACHE_MAX_ENTRIES = 500
+AI_MERGE_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
 
 def _infer_language_from_path(file_path: str) -> str:
     """Infer programming language from file extension."""
@@ -1811,6 +2043,93 @@ def _strip_code_fences(content: str) -> str:
     return content
 
 
+def _ai_merge_cache_path(task: ParallelMergeTask) -> Path:
+    """
+    Location of the cached AI merge for a task's exact inputs.
+
+    AI merges are slow and billed, and re-running a merge (e.g. after a
+    failed attempt or in a fresh session) hands the AI the same three
+    versions again. The key covers the cache version, the models and the
+    system prompt as well as every input to _build_merge_prompt (path, spec
+    name and all three contents), so a change to any of them misses the
+    cache.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        str(AI_MERGE_CACHE_VERSION),
+        MERGE_FAST_MODEL,
+        MERGE_CAPABLE_MODEL,
+        AI_MERGE_SYSTEM_PROMPT,
+        task.file_path,
+        task.spec_name,
+        task.main_content,
+        task.worktree_content,
+        task.base_content,
+    ):
+        # Tag byte plus length prefix: None never collides with any string
+        # and no part can bleed into the next one.
+        if part is None:
+            digest.update(b"\x00")
+            continue
+        data = part.encode("utf-8", errors="surrogatepass")
+        digest.update(b"\x01")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return (
+        task.project_dir / ".auto-claude" / "merge-cache" / f"{digest.hexdigest()}.txt"
+    )
+
+
+def _prune_ai_merge_cache(cache_dir: Path) -> None:
+    """
+    Drop cached AI merges older than the max age, then the oldest beyond the
+    max entry count. Cache hits refresh the mtime, so this evicts least
+    recently used entries first.
+    """
+    try:
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".txt") and entry.is_file():
+                entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return
+
+    entries.sort(reverse=True)
+    cutoff = time.time() - AI_MERGE_CACHE_MAX_AGE_SECONDS
+    for index, (mtime, path) in enumerate(entries):
+        if index >= AI_MERGE_CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _load_ai_merge(task: ParallelMergeTask) -> str | None:
+    """Return the cached AI merge for a task's inputs, or None on a miss."""
+    cache_path = _ai_merge_cache_path(task)
+    try:
+        cached = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        os.utime(cache_path)  # Keep recently used entries on prune
+    except OSError:
+        pass
+    return cached
+
+
+def _store_ai_merge(task: ParallelMergeTask, merged_content: str) -> None:
+    """Remember a validated AI merge so identical inputs skip the AI next time."""
+    cache_path = _ai_merge_cache_path(task)
+    try:
+        with atomic_write(cache_path) as f:
+            f.write(merged_content)
+    except OSError as e:
+        debug_warning(MODULE, f"Could not cache AI merge for {task.file_path}: {e}")
+        return
+    _prune_ai_merge_cache(cache_path.parent)
+
+
 async def _attempt_ai_merge(
     task: "ParallelMergeTask",
     prompt: str,
@@ -1870,7 +2189,7 @@ async def _attempt_ai_merge(
             "i apologize",
         ]
 
-        first_line = merged_content.split("\n")[0] if merged_content else ""
+        first_line = merged_content.partition("\n")[0]
         first_line_stripped = first_line.lstrip()
         first_line_lower = first_line_stripped.lower()
 
@@ -1905,10 +2224,28 @@ async def _attempt_ai_merge(
                 f"AI returned explanation instead of code: {first_line[:80]}...",
             )
 
-        # Validate syntax
-        is_valid, syntax_error = _validate_merged_syntax(
-            task.file_path, merged_content, task.project_dir
+        # Validate syntax off the event loop - the esbuild/compile subprocess
+        # would otherwise stall every other in-flight AI merge
+        is_valid, syntax_error = await asyncio.get_running_loop().run_in_executor(
+            None,
+            _validate_merged_syntax,
+            task.file_path,
+            merged_content,
+            task.project_dir,
         )
+        if not is_valid and task.file_path.endswith(".py"):
+            # Cheap local fix (e.g. unclosed brackets) before spending
+            # another full AI round-trip on the retry. Truncated responses
+            # are rejected by the repair and still go to the retry.
+            repaired = _repair_python_syntax(
+                merged_content,
+                task.file_path,
+                (task.main_content, task.worktree_content),
+            )
+            if repaired is not None:
+                debug(MODULE, f"Repaired Python syntax locally in {task.file_path}")
+                merged_content = repaired
+                is_valid = True
         if not is_valid:
             return False, None, f"Invalid syntax: {syntax_error}"
 
@@ -1949,6 +2286,40 @@ async def _merge_file_with_ai_async(
                     was_auto_merged=True,
                 )
 
+            # Then let git's line-level 3-way merge have a go - when the two
+            # sides touched different hunks it succeeds and no AI call is needed
+            loop = asyncio.get_running_loop()
+            if task.base_content is not None:
+                merged, had_conflicts = await loop.run_in_executor(
+                    None,
+                    _create_conflict_file_with_git,
+                    task.main_content,
+                    task.worktree_content,
+                    task.base_content,
+                    task.project_dir,
+                )
+                if merged is not None and not had_conflicts:
+                    debug(MODULE, f"Git auto-merged {task.file_path} without AI")
+                    return ParallelMergeResult(
+                        file_path=task.file_path,
+                        merged_content=merged,
+                        success=True,
+                        was_auto_merged=True,
+                    )
+
+            # An earlier run may already have AI-merged these exact inputs.
+            # Cache reads and writes touch the disk, so they run off the
+            # event loop like the syntax validation.
+            cached = await loop.run_in_executor(None, _load_ai_merge, task)
+            if cached is not None:
+                debug(MODULE, f"Reusing cached AI merge for {task.file_path}")
+                return ParallelMergeResult(
+                    file_path=task.file_path,
+                    merged_content=cached,
+                    success=True,
+                    was_auto_merged=False,
+                )
+
             # Need AI merge
             debug(MODULE, f"Using AI to merge {task.file_path}")
 
@@ -1988,6 +2359,7 @@ async def _merge_file_with_ai_async(
 
             if success and merged_content:
                 debug(MODULE, f"Haiku merged {task.file_path} successfully")
+                await loop.run_in_executor(None, _store_ai_merge, task, merged_content)
                 return ParallelMergeResult(
                     file_path=task.file_path,
                     merged_content=merged_content,
@@ -2010,6 +2382,7 @@ async def _merge_file_with_ai_async(
 
             if success and merged_content:
                 debug(MODULE, f"Sonnet merged {task.file_path} successfully")
+                await loop.run_in_executor(None, _store_ai_merge, task, merged_content)
                 return ParallelMergeResult(
                     file_path=task.file_path,
                     merged_content=merged_content,
@@ -32,6 +32,7 @@ AI_MERGE_SYSTEM_PROMPT = _workspace_module.AI_MERGE_SYSTEM_PROMPT
 _build_merge_prompt = _workspace_module._build_merge_prompt
 _check_git_conflicts = _workspace_module._check_git_conflicts
 _rebase_spec_branch = _workspace_module._rebase_spec_branch
+invalidate_merge_components = _workspace_module.invalidate_merge_components
 
 # Models and Enums
 # Display Functions
@@ -80,10 +81,12 @@ from .git_utils import (
     get_current_branch,
     get_existing_build_worktree,
     get_file_content_from_ref,
+    get_spec_paths,
     has_uncommitted_changes,
     is_binary_file,
     is_lock_file,
     is_process_running,
+    repair_python_syntax,
     validate_merged_syntax,
 )
 from .models import (
@@ -91,6 +94,7 @@ from .models import (
     MergeLockError,
     ParallelMergeResult,
     ParallelMergeTask,
+    SpecPaths,
     WorkspaceChoice,
     WorkspaceMode,
 )
@@ -115,6 +119,7 @@ __all__ = [
     "_build_merge_prompt",  # Internal prompt builder (ACS-194)
     "_check_git_conflicts",  # Internal git conflict detection (ACS-224)
     "_rebase_spec_branch",  # Internal rebase function (ACS-224)
+    "invalidate_merge_components",
     # Models
     "WorkspaceMode",
     "WorkspaceChoice",
@@ -122,16 +127,19 @@ __all__ = [
     "ParallelMergeResult",
     "MergeLock",
     "MergeLockError",
+    "SpecPaths",
     # Git Utils
     "has_uncommitted_changes",
     "get_current_branch",
     "get_existing_build_worktree",
+    "get_spec_paths",
     "get_file_content_from_ref",
     "get_binary_file_content_from_ref",
     "get_changed_files_from_branch",
     "is_process_running",
     "is_binary_file",
     "validate_merged_syntax",
+    "repair_python_syntax",
     "create_conflict_file_with_git",
     # Setup
     "choose_workspace",
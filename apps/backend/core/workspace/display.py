@@ -6,6 +6,8 @@ Workspace Display
 Functions for displaying workspace information and build summaries.
 """
 
+import sys
+
 from ui import (
     bold,
     error,
@@ -16,58 +18,77 @@ from ui import (
 from worktree import WorktreeManager
 
 
-def show_build_summary(manager: WorktreeManager, spec_name: str) -> None:
-    """Show a summary of what was built."""
-    summary = manager.get_change_summary(spec_name)
-    files = manager.get_changed_files(spec_name)
+def _plural(count: int) -> str:
+    return "s" if count != 1 else ""
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of lines to stdout in one call instead of one print() each."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    total = summary["new_files"] + summary["modified_files"] + summary["deleted_files"]
+
+def show_build_summary(
+    manager: WorktreeManager,
+    spec_name: str,
+    report: tuple[dict, list[tuple[str, str]]] | None = None,
+) -> None:
+    """Show a summary of what was built.
+
+    Pass the result of manager.get_change_report() as report to reuse it.
+    """
+    summary, _ = report or manager.get_change_report(spec_name)
+
+    new_files = summary["new_files"]
+    modified_files = summary["modified_files"]
+    deleted_files = summary["deleted_files"]
+    total = new_files + modified_files + deleted_files
 
     if total == 0:
         print_status("No changes were made.", "info")
         return
 
-    print()
-    print(bold("What was built:"))
-    if summary["new_files"] > 0:
-        print(
-            success(
-                f"  + {summary['new_files']} new file{'s' if summary['new_files'] != 1 else ''}"
-            )
-        )
-    if summary["modified_files"] > 0:
-        print(
-            info(
-                f"  ~ {summary['modified_files']} modified file{'s' if summary['modified_files'] != 1 else ''}"
-            )
-        )
-    if summary["deleted_files"] > 0:
-        print(
-            error(
-                f"  - {summary['deleted_files']} deleted file{'s' if summary['deleted_files'] != 1 else ''}"
-            )
+    lines = ["", bold("What was built:")]
+    if new_files > 0:
+        lines.append(success(f"  + {new_files} new file{_plural(new_files)}"))
+    if modified_files > 0:
+        lines.append(
+            info(f"  ~ {modified_files} modified file{_plural(modified_files)}")
         )
+    if deleted_files > 0:
+        lines.append(error(f"  - {deleted_files} deleted file{_plural(deleted_files)}"))
+    _write_lines(lines)
 
 
-def show_changed_files(manager: WorktreeManager, spec_name: str) -> None:
-    """Show detailed list of changed files."""
-    files = manager.get_changed_files(spec_name)
+def show_changed_files(
+    manager: WorktreeManager,
+    spec_name: str,
+    files: list[tuple[str, str]] | None = None,
+) -> None:
+    """Show detailed list of changed files.
+
+    Pass files (e.g. from manager.get_change_report()) to reuse them.
+    """
+    if files is None:
+        files = manager.get_changed_files(spec_name)
 
     if not files:
         print_status("No changes.", "info")
         return
 
-    print()
-    print(bold("Changed files:"))
+    # Color each status template once instead of once per file
+    templates = {
+        "A": success("  + {}"),
+        "M": info("  ~ {}"),
+        "D": error("  - {}"),
+    }
+    lines = ["", bold("Changed files:")]
     for status, filepath in files:
-        if status == "A":
-            print(success(f"  + {filepath}"))
-        elif status == "M":
-            print(info(f"  ~ {filepath}"))
-        elif status == "D":
-            print(error(f"  - {filepath}"))
+        template = templates.get(status)
+        if template is not None:
+            lines.append(template.format(filepath))
         else:
-            print(f"  {status} {filepath}")
+            lines.append(f"  {status} {filepath}")
+    _write_lines(lines)
 
 
 def print_merge_success(
@@ -86,10 +86,6 @@ def finalize_workspace(
 
     show_build_summary(manager, spec_name)
 
-    # Get the worktree path for test instructions
-    worktree_info = manager.get_worktree_info(spec_name)
-    staging_path = worktree_info.path if worktree_info else None
-
     # Enhanced menu for post-build options
     options = [
         MenuOption(
@@ -290,8 +286,9 @@ def review_existing_build(project_dir: Path, spec_name: str) -> bool:
     manager = WorktreeManager(project_dir)
     worktree_info = manager.get_worktree_info(spec_name)
 
-    show_build_summary(manager, spec_name)
-    show_changed_files(manager, spec_name)
+    report = manager.get_change_report(spec_name)
+    show_build_summary(manager, spec_name, report)
+    show_changed_files(manager, spec_name, report[1])
 
     print()
     print(muted("-" * 60))
@@ -6,11 +6,31 @@ Git Utilities
 Utility functions for git operations used in workspace management.
 """
 
+import functools
+import io
 import json
+import os
+import shutil
+import stat
 import subprocess
+import sys
+import threading
+import tokenize
 from pathlib import Path
 
-from core.git_executable import get_git_executable, run_git
+from core.git_blobs import (
+    _GIT_QUERY_ENV_OVERRIDES,
+    GitBlobReader,
+    _git_query,
+)
+from core.git_executable import get_git_executable, get_isolated_git_env, run_git
+
+from .models import SpecPaths
+
+try:
+    import orjson  # Optional: faster JSON parsing for merge validation
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 __all__ = [
     # Exported helpers
@@ -30,13 +50,17 @@ __all__ = [
     "has_uncommitted_changes",
     "get_current_branch",
     "get_existing_build_worktree",
+    "get_spec_paths",
     "get_file_content_from_ref",
+    "GitBlobReader",
     "get_binary_file_content_from_ref",
+    "get_blob_ids",
     "get_changed_files_from_branch",
     "is_process_running",
     "is_binary_file",
     "is_lock_file",
     "validate_merged_syntax",
+    "repair_python_syntax",
     "create_conflict_file_with_git",
     # Backward compat aliases
     "_is_process_running",
@@ -155,6 +179,9 @@ BINARY_EXTENSIONS = {
 # Merge lock timeout in seconds
 MERGE_LOCK_TIMEOUT = 300  # 5 minutes
 
+# Linux exposes every live PID as /proc/<pid>, a cheaper probe than kill()
+_HAS_PROCFS = sys.platform.startswith("linux")
+
 # Max retries for AI merge when syntax validation fails
 # Gives AI a chance to fix its mistakes before falling back
 MAX_SYNTAX_FIX_RETRIES = 2
@@ -248,16 +275,207 @@ def get_merge_base(project_dir: Path, ref1: str, ref2: str) -> str | None:
     Returns:
         Merge-base commit hash, or None if not found
     """
-    result = run_git(["merge-base", ref1, ref2], cwd=project_dir)
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    output = _git_query(project_dir, ["merge-base", ref1, ref2])
+    if output is None:
+        return None
+    return output.strip().decode("ascii")
+
+
+# Resolved git directories by project path, with the (inode, mtime) of the
+# project's .git entry at resolution time. A worktree's .git is a file
+# pointing elsewhere; re-reading it costs a stat plus a read, so a cached entry
+# is reused while a single stat shows the same .git entry. A worktree removed
+# and re-created at the same path gets a new .git file and is re-resolved.
+# Only successful lookups are cached.
+_GITDIR_CACHE: dict[Path, tuple[tuple[int, int], Path]] = {}
+
+
+def _resolve_gitdir(project_dir: Path) -> Path | None:
+    """
+    Return the git directory for a project, following worktree .git files.
+
+    Args:
+        project_dir: Project (or worktree) root
+
+    Returns:
+        Path to the git directory, or None if project_dir is not a git checkout
+    """
+    git_dir = project_dir / ".git"
+    try:
+        st = git_dir.stat()
+    except OSError:
+        _GITDIR_CACHE.pop(project_dir, None)
+        return None
+    signature = (st.st_ino, st.st_mtime_ns)
+
+    cached = _GITDIR_CACHE.get(project_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if stat.S_ISDIR(st.st_mode):
+        resolved = git_dir
+    elif stat.S_ISREG(st.st_mode):
+        # Worktrees (and submodules) use a "gitdir: <path>" pointer file
+        try:
+            content = git_dir.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        resolved = Path(content.split(":", 1)[1].strip())
+        if not resolved.is_absolute():
+            resolved = project_dir / resolved
+    else:
+        return None
+
+    _GITDIR_CACHE[project_dir] = (signature, resolved)
+    return resolved
+
+
+# Parsed packed-refs files: path -> (st_mtime_ns, {refname: sha})
+_PACKED_REFS_CACHE: dict[Path, tuple[int, dict[str, str]]] = {}
+
+
+def _is_sha(value: str) -> bool:
+    """True for a full SHA-1 or SHA-256 object name."""
+    if len(value) not in (40, 64):
+        return False
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+    return True
+
+
+def _lookup_packed_ref(common_dir: Path, refname: str) -> str | None:
+    """Look up a ref in packed-refs, reparsing only when the file changes."""
+    packed_path = common_dir / "packed-refs"
+    try:
+        mtime_ns = packed_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _PACKED_REFS_CACHE.get(packed_path)
+    if cached is None or cached[0] != mtime_ns:
+        refs: dict[str, str] = {}
+        try:
+            content = packed_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        for line in content.splitlines():
+            # Skip the header and peeled-tag ("^<sha>") lines
+            if not line or line[0] in "#^":
+                continue
+            sha, _, name = line.partition(" ")
+            refs[name] = sha
+        cached = (mtime_ns, refs)
+        _PACKED_REFS_CACHE[packed_path] = cached
+
+    return cached[1].get(refname)
+
+
+def _read_head_sha(project_dir: Path) -> str | None:
+    """
+    Return the commit HEAD points to, reading the git directory directly.
+
+    Handles the common layouts (detached HEAD, loose refs, packed-refs,
+    worktrees that keep refs in a shared common dir) with plain file reads.
+    Anything else - reftable repos, symbolic ref chains, unreadable files -
+    falls back to ``git rev-parse HEAD``.
+
+    Args:
+        project_dir: Project (or worktree) root
+
+    Returns:
+        HEAD commit SHA, or None if it cannot be determined
+    """
+    git_dir = _resolve_gitdir(project_dir)
+    if git_dir is not None:
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            sha: str | None = None
+            if head.startswith("ref: "):
+                refname = head[5:].strip()
+                # Worktrees keep HEAD locally but refs in the common dir
+                common_dir = git_dir
+                commondir_file = git_dir / "commondir"
+                if commondir_file.is_file():
+                    common = Path(commondir_file.read_text(encoding="utf-8").strip())
+                    common_dir = common if common.is_absolute() else git_dir / common
+                try:
+                    sha = (common_dir / refname).read_text(encoding="utf-8").strip()
+                except FileNotFoundError:
+                    sha = _lookup_packed_ref(common_dir, refname)
+            else:
+                sha = head
+            if sha and _is_sha(sha):
+                return sha
+        except (OSError, UnicodeDecodeError):
+            pass
+
+    result = run_git(["rev-parse", "HEAD"], cwd=project_dir)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _git_has_output(project_dir: Path, args: list[str], timeout: int = 60) -> bool:
+    """
+    Check whether a read-only git command prints anything.
+
+    Reads a single byte and terminates git as soon as one arrives, so a large
+    dirty tree doesn't have to be serialized in full. The read runs on a
+    helper thread (pipes aren't selectable on Windows) so a hung git is
+    killed after ``timeout`` seconds instead of blocking the caller.
+
+    Returns:
+        True if git printed output, False if it printed nothing, failed or
+        timed out
+    """
+    env = get_isolated_git_env()
+    env.update(_GIT_QUERY_ENV_OVERRIDES)
+    try:
+        proc = subprocess.Popen(
+            [get_git_executable(), *args],
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+    except OSError:
+        return False
+
+    first_byte: list[bytes] = []
+
+    def read_first_byte() -> None:
+        try:
+            if proc.stdout is not None:
+                first_byte.append(proc.stdout.read(1))
+        except (OSError, ValueError):
+            pass
+
+    # Popen's context manager closes the pipe and reaps git on exit
+    with proc:
+        reader = threading.Thread(target=read_first_byte, daemon=True)
+        reader.start()
+        reader.join(timeout)
+        if reader.is_alive():
+            # Killing git closes its end of the pipe, which unblocks the read
+            proc.kill()
+            reader.join()
+            return False
+        if first_byte and first_byte[0]:
+            proc.terminate()
+            return True
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        return False
 
 
 def has_uncommitted_changes(project_dir: Path) -> bool:
     """Check if user has unsaved work."""
-    result = run_git(["status", "--porcelain"], cwd=project_dir)
-    return bool(result.stdout.strip())
+    # Any status entry means dirty; stop reading after the first byte
+    return _git_has_output(project_dir, ["status", "--porcelain", "-z"])
 
 
 def get_current_branch(project_dir: Path) -> str:
@@ -266,6 +484,25 @@ def get_current_branch(project_dir: Path) -> str:
     return result.stdout.strip()
 
 
+@functools.lru_cache(maxsize=256)
+def get_spec_paths(project_dir: Path, spec_name: str) -> SpecPaths:
+    """
+    Get the worktree paths and branch name for a spec.
+
+    Args:
+        project_dir: The main project directory
+        spec_name: The spec folder name (e.g., "001-feature-name")
+
+    Returns:
+        SpecPaths (cached; the result is immutable)
+    """
+    return SpecPaths(
+        worktree=project_dir / ".auto-claude" / "worktrees" / "tasks" / spec_name,
+        legacy_worktree=project_dir / ".worktrees" / spec_name,
+        branch=f"auto-claude/{spec_name}",
+    )
+
+
 def get_existing_build_worktree(project_dir: Path, spec_name: str) -> Path | None:
     """
     Check if there's an existing worktree for this specific spec.
@@ -277,15 +514,15 @@ def get_existing_build_worktree(project_dir: Path, spec_name: str) -> Path | Non
     Returns:
         Path to the worktree if it exists for this spec, None otherwise
     """
-    # New path first
-    new_path = project_dir / ".auto-claude" / "worktrees" / "tasks" / spec_name
-    if new_path.exists():
-        return new_path
+    paths = get_spec_paths(project_dir, spec_name)
+
+    # New path first (os.path.isdir: one stat, no Path method dispatch)
+    if os.path.isdir(paths.worktree):
+        return paths.worktree
 
     # Legacy fallback
-    legacy_path = project_dir / ".worktrees" / spec_name
-    if legacy_path.exists():
-        return legacy_path
+    if os.path.isdir(paths.legacy_worktree):
+        return paths.legacy_worktree
 
     return None
 
@@ -308,19 +545,45 @@ def get_binary_file_content_from_ref(
     Unlike get_file_content_from_ref, this returns raw bytes without
     text decoding, suitable for binary files like images, audio, etc.
 
-    Note: Uses subprocess directly with get_git_executable() since
-    run_git() always returns text output.
+    Note: Uses _git_query() since run_git() always returns text output.
+    """
+    return _git_query(project_dir, ["show", f"{ref}:{file_path}"])
+
+
+def get_blob_ids(project_dir: Path, objects: list[tuple[str, str]]) -> list[str | None]:
     """
-    git = get_git_executable()
-    result = subprocess.run(
-        [git, "show", f"{ref}:{file_path}"],
-        cwd=project_dir,
-        capture_output=True,
-        text=False,  # Return bytes, not text
+    Look up the object ID of each (ref, file_path) with one git cat-file call.
+
+    Returns:
+        One entry per input, None where the path doesn't exist at that ref
+        (or couldn't be looked up)
+    """
+    if not objects:
+        return []
+    # Batch input is newline-delimited, so such paths can't be looked up
+    queryable = ["\n" not in ref and "\n" not in path for ref, path in objects]
+    request = "".join(
+        f"{ref}:{path}\n" for (ref, path), ok in zip(objects, queryable) if ok
     )
-    if result.returncode == 0:
-        return result.stdout
-    return None
+    output = None
+    if request:
+        output = _git_query(
+            project_dir,
+            ["cat-file", "--batch-check=%(objectname)"],
+            input_data=request.encode(),
+        )
+    if output is None:
+        return [None] * len(objects)
+
+    # One line per request: the object ID, or "<object> missing". Split on
+    # "\n" only - str.splitlines() would also break on characters such as
+    # \x0c or \u2028 in an echoed path and shift every later answer.
+    lines = iter(output.split(b"\n"))
+    blob_ids: list[str | None] = []
+    for ok in queryable:
+        line = next(lines, b"").decode(errors="replace") if ok else ""
+        blob_ids.append(line if line and " " not in line else None)
+    return blob_ids
 
 
 def get_changed_files_from_branch(
@@ -341,22 +604,29 @@ def get_changed_files_from_branch(
     Returns:
         List of (file_path, status) tuples
     """
-    result = run_git(
-        ["diff", "--name-status", f"{base_branch}...{spec_branch}"],
-        cwd=project_dir,
+    # -z gives "<status>\0<path>\0" records with paths unquoted, so names
+    # containing tabs or newlines survive. --no-renames keeps every record to a
+    # single path (a rename is reported as D + A).
+    output = _git_query(
+        project_dir,
+        [
+            "diff",
+            "-z",
+            "--no-renames",
+            "--name-status",
+            f"{base_branch}...{spec_branch}",
+        ],
     )
 
     files = []
-    if result.returncode == 0:
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    file_path = parts[1]
-                    # Exclude .auto-claude directory files from merge
-                    if exclude_auto_claude and _is_auto_claude_file(file_path):
-                        continue
-                    files.append((file_path, parts[0]))  # (file_path, status)
+    if output:
+        records = output.split(b"\0")
+        for status, path in zip(records[0::2], records[1::2]):
+            file_path = path.decode("utf-8", "surrogateescape")
+            # Exclude .auto-claude directory files from merge
+            if exclude_auto_claude and _is_auto_claude_file(file_path):
+                continue
+            files.append((file_path, status.decode()))  # (file_path, status)
     return files
 
 
@@ -383,7 +653,10 @@ def _is_auto_claude_file(file_path: str) -> bool:
 
 def is_process_running(pid: int) -> bool:
     """Check if a process with the given PID is running."""
-    import os
+    if _HAS_PROCFS:
+        # One stat, and unlike kill() it isn't fooled by EPERM for processes
+        # owned by another user
+        return pid > 0 and os.path.exists(f"/proc/{pid}")
 
     try:
         os.kill(pid, 0)
@@ -392,9 +665,25 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
-def is_binary_file(file_path: str) -> bool:
-    """Check if a file is binary based on extension."""
-    return Path(file_path).suffix.lower() in BINARY_EXTENSIONS
+def is_binary_file(file_path: str, content: bytes | None = None) -> bool:
+    """
+    Check if a file is binary based on extension.
+
+    If the file's content is already in memory, pass it to also catch binaries
+    without a known extension: like git, a NUL byte in the first 8000 bytes
+    marks it as binary. Only that prefix is scanned.
+    """
+    # Plain string ops instead of building a Path per call. Like Path.suffix,
+    # a leading dot (".gitignore") or a trailing one isn't an extension.
+    dot = file_path.rfind(".")
+    start = max(file_path.rfind("/"), file_path.rfind("\\")) + 1
+    if (
+        dot > start
+        and dot != len(file_path) - 1
+        and file_path[dot:].lower() in BINARY_EXTENSIONS
+    ):
+        return True
+    return content is not None and content.find(b"\0", 0, 8000) != -1
 
 
 def is_lock_file(file_path: str) -> bool:
@@ -407,123 +696,235 @@ def is_lock_file(file_path: str) -> bool:
     return Path(file_path).name in LOCK_FILES
 
 
-def validate_merged_syntax(
+@functools.lru_cache(maxsize=32)
+def _find_esbuild(project_dir: Path) -> str | None:
+    """
+    Locate the project's esbuild binary (cached per project).
+
+    Merges validate many files against the same project, so the node_modules
+    scan (including the pnpm store glob) only runs once per project.
+    """
+    # Try to find esbuild in node_modules (works with pnpm, npm, yarn)
+    for search_dir in [project_dir, project_dir.parent]:
+        # Standard npm/yarn location
+        npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
+        if npm_esbuild.exists():
+            return str(npm_esbuild)
+        # pnpm stores it differently
+        pnpm_esbuild = search_dir / "node_modules" / ".pnpm"
+        if pnpm_esbuild.exists():
+            for esbuild_dir in pnpm_esbuild.glob(
+                "esbuild@*/node_modules/esbuild/bin/esbuild"
+            ):
+                if esbuild_dir.exists():
+                    return str(esbuild_dir)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _find_npx() -> str | None:
+    """Locate npx on PATH (probed once per process)."""
+    return shutil.which("npx")
+
+
+def _validate_js_syntax(
     file_path: str, content: str, project_dir: Path
 ) -> tuple[bool, str]:
     """
-    Validate the syntax of merged code.
-
-    Returns (is_valid, error_message).
+    Validate TypeScript/JavaScript with esbuild.
 
-    Uses esbuild for TypeScript/JavaScript validation as it:
+    esbuild is used as it:
     - Is much faster than tsc (no npm setup overhead)
     - Has accurate JSX/TSX parsing (matches Vite's behavior)
     - Works in isolation without tsconfig.json
     """
     import tempfile
-    from pathlib import Path as P
 
-    ext = P(file_path).suffix.lower()
+    ext = Path(file_path).suffix.lower()
+    try:
+        esbuild_cmd = _find_esbuild(project_dir)
+        if not esbuild_cmd and _find_npx() is None:
+            # No esbuild and no npx to fetch it - skip validation without
+            # spawning a process just to hit FileNotFoundError
+            return True, ""
 
-    # TypeScript/JavaScript validation using esbuild
-    if ext in {".ts", ".tsx", ".js", ".jsx"}:
-        try:
-            # Write to temp file in system temp dir (NOT project dir to avoid HMR triggers)
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=ext,
-                delete=False,
-                # Don't set dir= to avoid writing to project directory which triggers HMR
-            ) as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
+        # Write to temp file in system temp dir (NOT project dir to avoid HMR triggers)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=ext,
+            delete=False,
+            # Don't set dir= to avoid writing to project directory which triggers HMR
+        ) as tmp:
+            tmp.write(content)
+            tmp_path = tmp.name
 
-            try:
-                # Find esbuild binary - try multiple locations
-                esbuild_cmd = None
-
-                # Try to find esbuild in node_modules (works with pnpm, npm, yarn)
-                for search_dir in [project_dir, project_dir.parent]:
-                    # pnpm stores it differently
-                    pnpm_esbuild = search_dir / "node_modules" / ".pnpm"
-                    if pnpm_esbuild.exists():
-                        for esbuild_dir in pnpm_esbuild.glob(
-                            "esbuild@*/node_modules/esbuild/bin/esbuild"
-                        ):
-                            if esbuild_dir.exists():
-                                esbuild_cmd = str(esbuild_dir)
-                                break
-                    # Standard npm/yarn location
-                    npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
-                    if npm_esbuild.exists():
-                        esbuild_cmd = str(npm_esbuild)
-                        break
-                    if esbuild_cmd:
-                        break
-
-                # Fall back to npx if not found
-                if not esbuild_cmd:
-                    esbuild_cmd = "npx"
-                    args = ["npx", "esbuild", tmp_path, "--log-level=error"]
-                else:
-                    args = [esbuild_cmd, tmp_path, "--log-level=error"]
-
-                # Use esbuild for fast, accurate syntax validation
-                # esbuild infers loader from extension (.tsx, .ts, etc.)
-                # --log-level=error only shows errors
-                result = subprocess.run(
-                    args,
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=15,  # esbuild is fast, 15s is plenty
-                )
+        try:
+            # Fall back to npx if not found
+            if not esbuild_cmd:
+                esbuild_cmd = "npx"
+                args = ["npx", "esbuild", tmp_path, "--log-level=error"]
+            else:
+                args = [esbuild_cmd, tmp_path, "--log-level=error"]
+
+            # Use esbuild for fast, accurate syntax validation
+            # esbuild infers loader from extension (.tsx, .ts, etc.)
+            # --log-level=error only shows errors
+            result = subprocess.run(
+                args,
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=15,  # esbuild is fast, 15s is plenty
+            )
 
-                if result.returncode != 0:
-                    # Filter out npm warnings and extract actual errors
-                    error_output = result.stderr.strip()
-                    error_lines = [
-                        line
-                        for line in error_output.split("\n")
-                        if line
-                        and not line.startswith("npm warn")
-                        and not line.startswith("npm WARN")
-                    ]
-                    if error_lines:
-                        # Extract just the error message, not full path
-                        error_msg = "\n".join(error_lines[:3])
-                        return False, f"Syntax error: {error_msg}"
-
-                return True, ""
-
-            finally:
-                P(tmp_path).unlink(missing_ok=True)
+            if result.returncode != 0:
+                # Filter out npm warnings and extract actual errors
+                error_output = result.stderr.strip()
+                error_lines = [
+                    line
+                    for line in error_output.split("\n")
+                    if line
+                    and not line.startswith("npm warn")
+                    and not line.startswith("npm WARN")
+                ]
+                if error_lines:
+                    # Extract just the error message, not full path
+                    error_msg = "\n".join(error_lines[:3])
+                    return False, f"Syntax error: {error_msg}"
 
-        except subprocess.TimeoutExpired:
-            return True, ""  # Timeout = assume ok
-        except FileNotFoundError:
-            return True, ""  # No esbuild = skip validation
-        except Exception as e:
-            return True, ""  # Other errors = skip validation
-
-    # Python validation
-    elif ext == ".py":
-        try:
-            compile(content, file_path, "exec")
             return True, ""
-        except SyntaxError as e:
-            return False, f"Python syntax error: {e.msg} at line {e.lineno}"
 
-    # JSON validation
-    elif ext == ".json":
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    except subprocess.TimeoutExpired:
+        return True, ""  # Timeout = assume ok
+    except FileNotFoundError:
+        return True, ""  # No esbuild = skip validation
+    except Exception:
+        return True, ""  # Other errors = skip validation
+
+
+def _validate_python_syntax(
+    file_path: str, content: str, project_dir: Path
+) -> tuple[bool, str]:
+    """Validate Python by compiling it."""
+    try:
+        compile(content, file_path, "exec")
+        return True, ""
+    except SyntaxError as e:
+        return False, f"Python syntax error: {e.msg} at line {e.lineno}"
+
+
+def _validate_json_syntax(
+    file_path: str, content: str, project_dir: Path
+) -> tuple[bool, str]:
+    """Validate JSON by parsing it."""
+    if orjson is not None:
         try:
-            json.loads(content)
+            orjson.loads(content)
             return True, ""
-        except json.JSONDecodeError as e:
-            return False, f"JSON error: {e.msg} at line {e.lineno}"
+        except (orjson.JSONDecodeError, UnicodeError):
+            # orjson is stricter than json (e.g. rejects NaN and lone
+            # surrogates) - let json give the verdict and the message
+            pass
+    try:
+        json.loads(content)
+        return True, ""
+    except json.JSONDecodeError as e:
+        return False, f"JSON error: {e.msg} at line {e.lineno}"
+
+
+# Syntax validator per (lower-cased) file extension
+_SYNTAX_VALIDATORS = {
+    ".ts": _validate_js_syntax,
+    ".tsx": _validate_js_syntax,
+    ".js": _validate_js_syntax,
+    ".jsx": _validate_js_syntax,
+    ".py": _validate_python_syntax,
+    ".json": _validate_json_syntax,
+}
+
+
+def validate_merged_syntax(
+    file_path: str, content: str, project_dir: Path
+) -> tuple[bool, str]:
+    """
+    Validate the syntax of merged code.
 
-    # Other file types - skip validation
-    return True, ""
+    Returns (is_valid, error_message).
+
+    TypeScript/JavaScript is checked with esbuild, Python with compile() and
+    JSON with json.loads. Other file types are not validated.
+    """
+    validator = _SYNTAX_VALIDATORS.get(Path(file_path).suffix.lower())
+    if validator is None:
+        return True, ""
+    return validator(file_path, content, project_dir)
+
+
+_CLOSING_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+# A locally repaired merge may be this much shorter than the shorter input
+# (a side's deletions) before it is treated as truncated
+REPAIR_LINE_TOLERANCE = 0.1
+
+
+def repair_python_syntax(
+    content: str, file_path: str, sources: tuple[str, ...]
+) -> str | None:
+    """
+    Try to fix a Python syntax error locally instead of asking the AI again.
+
+    Handles the AI dropping the final closing bracket(s) of an otherwise
+    complete file: the still-open brackets are closed at end of file. A
+    response cut off mid-file looks the same to the tokenizer, so the repair
+    is only accepted when the output provably reaches the end of the file -
+    its last line must match the last line of one of the merge ``sources``
+    and it must be about as long as the shorter source. Returns the repaired
+    content if it then compiles, otherwise None.
+    """
+    stack: list[str] = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(content).readline):
+            if token.type != tokenize.OP:
+                continue
+            if token.string in _CLOSING_BRACKETS:
+                stack.append(token.string)
+            elif token.string in ")]}":
+                if not stack or _CLOSING_BRACKETS[stack.pop()] != token.string:
+                    return None  # Mismatched bracket - not a trivial fix
+    except tokenize.TokenError:
+        pass  # Raised at EOF while brackets are still open
+    except (SyntaxError, ValueError):
+        return None
+
+    if not stack:
+        return None
+
+    repaired = (
+        content.rstrip()
+        + "".join(_CLOSING_BRACKETS[bracket] for bracket in reversed(stack))
+        + "\n"
+    )
+
+    # Reject truncations: closing the brackets would make them compile while
+    # silently dropping everything after the cut
+    last_line = repaired.rstrip().rsplit("\n", 1)[-1].strip()
+    source_last_lines = {
+        source.rstrip().rsplit("\n", 1)[-1].strip() for source in sources
+    }
+    min_lines = min((source.rstrip().count("\n") + 1 for source in sources), default=0)
+    if last_line not in source_last_lines or (
+        repaired.rstrip().count("\n") + 1 < min_lines * (1 - REPAIR_LINE_TOLERANCE)
+    ):
+        return None
+
+    try:
+        compile(repaired, file_path, "exec")
+    except (SyntaxError, ValueError):
+        return None
+    return repaired
 
 
 def create_conflict_file_with_git(
@@ -542,6 +943,16 @@ def create_conflict_file_with_git(
     import tempfile
 
     try:
+        if hasattr(os, "memfd_create"):
+            try:
+                result = _merge_file_in_memory(
+                    project_dir, (main_content, base_content or "", worktree_content)
+                )
+            except OSError:
+                pass  # memfd unavailable (e.g. sandboxed) - use temp files
+            else:
+                return _merge_file_outcome(result)
+
         # Create temp files for three-way merge
         with tempfile.NamedTemporaryFile(
             mode="w", delete=False, suffix=".tmp"
@@ -553,46 +964,81 @@ def create_conflict_file_with_git(
             wt_f.write(worktree_content)
             wt_path = wt_f.name
 
-        # Use empty base if not available
-        if base_content:
-            with tempfile.NamedTemporaryFile(
-                mode="w", delete=False, suffix=".tmp"
-            ) as base_f:
-                base_f.write(base_content)
-                base_path = base_f.name
+        # Use empty base if not available - on POSIX the null device is an
+        # empty file git can read, so there is nothing to write or unlink
+        if not base_content and os.name != "nt":
+            base_path = os.devnull
         else:
             with tempfile.NamedTemporaryFile(
                 mode="w", delete=False, suffix=".tmp"
             ) as base_f:
-                base_f.write("")
+                base_f.write(base_content or "")
                 base_path = base_f.name
 
         try:
             # git merge-file <current> <base> <other>
-            # Exit codes: 0 = clean merge, 1 = conflicts, >1 = error
             result = run_git(
                 ["merge-file", "-p", main_path, base_path, wt_path],
                 cwd=project_dir,
             )
-
-            # Read the merged content
-            merged_content = result.stdout
-
-            # Check for conflicts
-            had_conflicts = result.returncode == 1
-
-            return merged_content, had_conflicts
+            return _merge_file_outcome(result)
 
         finally:
             # Cleanup temp files
             Path(main_path).unlink(missing_ok=True)
             Path(wt_path).unlink(missing_ok=True)
-            Path(base_path).unlink(missing_ok=True)
+            if base_path != os.devnull:
+                Path(base_path).unlink(missing_ok=True)
 
     except Exception as e:
         return None, False
 
 
+def _merge_file_outcome(
+    result: subprocess.CompletedProcess,
+) -> tuple[str | None, bool]:
+    """Turn a ``git merge-file -p`` run into (merged_content_or_none, had_conflicts)."""
+    # Exit codes: 0 = clean merge, 1-127 = number of conflicts, else an error
+    # (whose empty output must not pass for a clean merge)
+    if not 0 <= result.returncode <= 127:
+        return None, False
+    return result.stdout, result.returncode > 0
+
+
+def _merge_file_in_memory(
+    project_dir: Path, contents: tuple[str, str, str]
+) -> subprocess.CompletedProcess:
+    """
+    Run ``git merge-file -p`` on (current, base, other) without temp files.
+
+    git sizes its inputs with stat(), so they can't be pipes. Each one is an
+    anonymous in-memory file (Linux memfd) that git opens through /dev/fd,
+    so nothing is written to or unlinked from disk.
+    """
+    fds: list[int] = []
+    try:
+        for content in contents:
+            fd = os.memfd_create("auto-claude-merge")
+            fds.append(fd)
+            with os.fdopen(fd, "wb", closefd=False) as f:
+                f.write(content.encode("utf-8"))
+        return subprocess.run(
+            [get_git_executable(), "merge-file", "-p"]
+            + [f"/dev/fd/{fd}" for fd in fds],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=60,
+            env=get_isolated_git_env(),
+            pass_fds=fds,
+        )
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
 # Export the _is_process_running function for backward compatibility
 _is_process_running = is_process_running
 _is_binary_file = is_binary_file
@@ -50,6 +50,15 @@ class ParallelMergeResult:
     was_auto_merged: bool = False  # True if git auto-merged without AI
 
 
+@dataclass(frozen=True, slots=True)
+class SpecPaths:
+    """Locations derived from a spec name (see git_utils.get_spec_paths)."""
+
+    worktree: Path  # .auto-claude/worktrees/tasks/{spec_name}
+    legacy_worktree: Path  # .worktrees/{spec_name}
+    branch: str  # auto-claude/{spec_name}
+
+
 class MergeLockError(Exception):
     """Raised when a merge lock cannot be acquired."""
 
@@ -90,35 +99,43 @@ class MergeLock:
                     os.O_CREAT | os.O_EXCL | os.O_WRONLY,
                     0o644,
                 )
-                os.close(fd)
-
-                # Write our PID to the lock file
-                self.lock_file.write_text(str(os.getpid()), encoding="utf-8")
+                # Write our PID through the same descriptor, so the file is
+                # never reopened and never seen half-written for long
+                try:
+                    os.write(fd, str(os.getpid()).encode())
+                finally:
+                    os.close(fd)
                 self.acquired = True
                 return self
 
             except FileExistsError:
                 # Lock file exists - check if process is still running
-                if self.lock_file.exists():
+                # Import locally to avoid circular dependency
+                from .git_utils import is_process_running
+
+                try:
+                    content = self.lock_file.read_text(encoding="utf-8").strip()
+                except FileNotFoundError:
+                    # Released while we looked - try again right away
+                    continue
+                try:
+                    pid = int(content)
+                except ValueError:
+                    pid = None
+                if pid is None and not content:
+                    # The holder may not have written its PID yet; only an
+                    # empty lock left behind for a while is stale
                     try:
-                        pid = int(self.lock_file.read_text(encoding="utf-8").strip())
-                        # Import locally to avoid circular dependency
-                        import os as _os
-
-                        try:
-                            _os.kill(pid, 0)
-                            is_running = True
-                        except (OSError, ProcessLookupError):
-                            is_running = False
-
-                        if not is_running:
-                            # Stale lock - remove it
-                            self.lock_file.unlink()
-                            continue
-                    except (ValueError, ProcessLookupError):
-                        # Invalid PID or can't check - remove stale lock
-                        self.lock_file.unlink()
+                        age = time.time() - self.lock_file.stat().st_mtime
+                    except FileNotFoundError:
                         continue
+                    stale = age > 5
+                else:
+                    stale = pid is None or not is_process_running(pid)
+                if stale:
+                    # Invalid PID or dead holder - remove stale lock
+                    self.lock_file.unlink(missing_ok=True)
+                    continue
 
                 # Active lock - wait or timeout
                 if time.time() - start_time >= max_wait:
@@ -130,9 +147,9 @@ class MergeLock:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Release the merge lock."""
-        if self.acquired and self.lock_file.exists():
+        if self.acquired:
             try:
-                self.lock_file.unlink()
+                self.lock_file.unlink(missing_ok=True)
             except Exception:
                 pass  # Best effort cleanup
 
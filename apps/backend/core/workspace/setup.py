@@ -6,15 +6,15 @@ Workspace Setup
 Functions for setting up and initializing workspaces.
 """
 
+import errno
 import json
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from core.git_executable import run_git
-from merge import FileTimelineTracker
 from security.constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
 from ui import (
     Icons,
@@ -28,9 +28,14 @@ from ui import (
 )
 from worktree import WorktreeManager
 
-from .git_utils import has_uncommitted_changes
+from .git_utils import _read_head_sha, _resolve_gitdir, has_uncommitted_changes
 from .models import WorkspaceMode
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
 # Import debug utilities
 try:
     from debug import debug, debug_warning
@@ -48,6 +53,22 @@ _git_hook_check_done = False
 
 MODULE = "workspace.setup"
 
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_COPY_MIN_FILES = 16
+
+# Linux FICLONE ioctl: share the source's extents (btrfs, XFS, bcachefs)
+# instead of copying bytes. Python 3.14's shutil does something similar via
+# copy_file_range; older versions always read and write every byte.
+_FICLONE = 0x40049409
+_REFLINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.ENOSYS,
+}
+_reflink_supported = fcntl is not None and sys.platform.startswith("linux")
+
 
 def choose_workspace(
     project_dir: Path,
@@ -283,6 +304,64 @@ def symlink_node_modules_to_worktree(
     return symlinked
 
 
+def _clone_copy2(src: str, dst: str) -> str:
+    """
+    shutil.copy2 that tries a copy-on-write clone first.
+
+    The first clone failure that means "not supported here" disables the
+    fast path for the rest of the process; other errors fall back to
+    shutil.copy2, which raises them properly.
+    """
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                _reflink_supported = False
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
+
+
+def _parallel_copytree(src: Path, dst: Path) -> None:
+    """
+    Copy a directory tree, fanning per-file copies out to a thread pool.
+
+    Directories are created up front (cheap, serial); file copies release the
+    GIL during I/O, so they overlap well on trees with many small files.
+    Like shutil.copytree, symlinks are followed and copied as regular files,
+    and each directory gets its source's mode and times once it is filled.
+    """
+    dirs_copied: list[tuple[str, str]] = []
+    src_files: list[str] = []
+    dst_files: list[str] = []
+    for root, dirs, files in os.walk(src, followlinks=True):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root, exist_ok=True)
+        dirs_copied.append((root, target_root))
+        for name in files:
+            src_files.append(os.path.join(root, name))
+            dst_files.append(os.path.join(target_root, name))
+
+    if len(src_files) < _PARALLEL_COPY_MIN_FILES:
+        for src_file, dst_file in zip(src_files, dst_files):
+            _clone_copy2(src_file, dst_file)
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(src_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results so the first copy error is raised here
+            for _ in executor.map(_clone_copy2, src_files, dst_files):
+                pass
+
+    # Deepest first, as copytree does, so filling a child never bumps the
+    # parent's mtime after it has been set
+    for src_dir, dst_dir in reversed(dirs_copied):
+        shutil.copystat(src_dir, dst_dir)
+
+
 def copy_spec_to_worktree(
     source_spec_dir: Path,
     worktree_path: Path,
@@ -310,11 +389,14 @@ def copy_spec_to_worktree(
     # Create parent directories if needed
     target_spec_dir.parent.mkdir(parents=True, exist_ok=True)
 
-    # Copy spec files (overwrite if exists to get latest)
-    if target_spec_dir.exists():
+    # Copy spec files (overwrite if exists to get latest). rmtree already walks
+    # with os.scandir, so just skip the separate exists() stat.
+    try:
         shutil.rmtree(target_spec_dir)
+    except FileNotFoundError:
+        pass
 
-    shutil.copytree(source_spec_dir, target_spec_dir)
+    _parallel_copytree(source_spec_dir, target_spec_dir)
 
     return target_spec_dir
 
@@ -363,6 +445,25 @@ def setup_workspace(
     # Get or create worktree for THIS SPECIFIC SPEC
     worktree_info = manager.get_or_create_worktree(spec_name)
 
+    # Copy spec files and initialize FileTimelineTracker for this task in the
+    # background while the rest of the workspace is prepared; nothing below
+    # touches the worktree's .auto-claude/specs/ or the timeline files. The
+    # tracker reads the plan from the source spec dir, which the copy mirrors.
+    background = ThreadPoolExecutor(max_workers=2)
+    spec_copy: Future[Path] | None = None
+    if source_spec_dir and source_spec_dir.exists():
+        spec_copy = background.submit(
+            copy_spec_to_worktree, source_spec_dir, worktree_info.path, spec_name
+        )
+    timeline_init = background.submit(
+        initialize_timeline_tracking,
+        project_dir=project_dir,
+        spec_name=spec_name,
+        worktree_path=worktree_info.path,
+        source_spec_dir=source_spec_dir,
+    )
+    background.shutdown(wait=False)
+
     # Copy .env files to worktree so user can run the project
     copied_env_files = copy_env_files_to_worktree(project_dir, worktree_info.path)
     if copied_env_files:
@@ -432,25 +533,18 @@ def setup_workspace(
     if ensure_gitignore_entry(worktree_info.path, ".auto-claude/"):
         debug(MODULE, "Added .auto-claude/ to worktree's .gitignore")
 
-    # Copy spec files to worktree if provided
+    # The AI reads the spec first, so wait for the copy before returning.
+    # Wait for the timeline too, so a merge right after setup (or process
+    # exit) never sees half-written timeline files.
     localized_spec_dir = None
-    if source_spec_dir and source_spec_dir.exists():
-        localized_spec_dir = copy_spec_to_worktree(
-            source_spec_dir, worktree_info.path, spec_name
-        )
+    if spec_copy is not None:
+        localized_spec_dir = spec_copy.result()
         print_status("Spec files copied to workspace", "success")
+    timeline_init.result()
 
     print_status(f"Workspace ready: {worktree_info.path.name}", "success")
     print()
 
-    # Initialize FileTimelineTracker for this task
-    initialize_timeline_tracking(
-        project_dir=project_dir,
-        spec_name=spec_name,
-        worktree_path=worktree_info.path,
-        source_spec_dir=localized_spec_dir or source_spec_dir,
-    )
-
     return worktree_info.path, manager, localized_spec_dir
 
 
@@ -468,25 +562,20 @@ def ensure_timeline_hook_installed(project_dir: Path) -> None:
     _git_hook_check_done = True
 
     try:
-        git_dir = project_dir / ".git"
-        if not git_dir.exists():
+        # Handles worktrees (where .git is a file, not directory)
+        git_dir = _resolve_gitdir(project_dir)
+        if git_dir is None:
             return  # Not a git repo
 
-        # Handle worktrees (where .git is a file, not directory)
-        if git_dir.is_file():
-            content = git_dir.read_text(encoding="utf-8").strip()
-            if content.startswith("gitdir:"):
-                git_dir = Path(content.split(":", 1)[1].strip())
-            else:
-                return
-
         hook_path = git_dir / "hooks" / "post-commit"
 
-        # Check if hook already installed
-        if hook_path.exists():
-            if "FileTimelineTracker" in hook_path.read_text(encoding="utf-8"):
+        # Check if hook already installed (one open instead of stat + open)
+        try:
+            if b"FileTimelineTracker" in hook_path.read_bytes():
                 debug(MODULE, "FileTimelineTracker hook already installed")
                 return
+        except FileNotFoundError:
+            pass
 
         # Auto-install the hook (silent, non-intrusive)
         from merge.install_hook import install_hook
@@ -512,39 +601,38 @@ def initialize_timeline_tracking(
     enabling intent-aware merge conflict resolution later.
     """
     try:
+        from merge import FileTimelineTracker
+
         tracker = FileTimelineTracker(project_dir)
 
         # Get task intent from implementation plan
         task_intent = ""
         task_title = spec_name
-        files_to_modify = []
+        files_to_modify: set[str] = set()
 
         if source_spec_dir:
             plan_path = source_spec_dir / "implementation_plan.json"
-            if plan_path.exists():
-                with open(plan_path, encoding="utf-8") as f:
-                    plan = json.load(f)
+            try:
+                plan = json.loads(plan_path.read_bytes())
+            except FileNotFoundError:
+                plan = None
+            if plan is not None:
                 task_title = plan.get("title", spec_name)
                 task_intent = plan.get("description", "")
 
-                # Extract files from phases/subtasks
-                for phase in plan.get("phases", []):
-                    for subtask in phase.get("subtasks", []):
-                        files_to_modify.extend(subtask.get("files", []))
+                # Extract files from phases/subtasks, deduplicating as we go
+                for phase in plan.get("phases", ()):
+                    for subtask in phase.get("subtasks", ()):
+                        files_to_modify.update(subtask.get("files", ()))
 
         # Get the current branch point commit
-        # Note: run_git() already handles capture_output and encoding internally
-        result = run_git(
-            ["rev-parse", "HEAD"],
-            cwd=project_dir,
-        )
-        branch_point = result.stdout.strip() if result.returncode == 0 else None
+        branch_point = _read_head_sha(project_dir)
 
         if files_to_modify and branch_point:
             # Register the task with known files
             tracker.on_task_start(
                 task_id=spec_name,
-                files_to_modify=list(set(files_to_modify)),  # Dedupe
+                files_to_modify=list(files_to_modify),
                 branch_point_commit=branch_point,
                 task_intent=task_intent,
                 task_title=task_title,
@@ -20,6 +20,7 @@ import re
 import shutil
 import subprocess
 import time
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -769,19 +770,27 @@ class WorktreeManager:
 
         return files
 
-    def get_change_summary(self, spec_name: str) -> dict:
-        """Get a summary of changes in a worktree."""
-        files = self.get_changed_files(spec_name)
+    def get_change_report(self, spec_name: str) -> tuple[dict, list[tuple[str, str]]]:
+        """
+        Get the change summary and changed file list from a single git diff.
 
-        new_files = sum(1 for status, _ in files if status == "A")
-        modified_files = sum(1 for status, _ in files if status == "M")
-        deleted_files = sum(1 for status, _ in files if status == "D")
+        Returns:
+            Tuple of (summary dict as returned by get_change_summary,
+            list of (status, path) as returned by get_changed_files)
+        """
+        files = self.get_changed_files(spec_name)
+        counts = Counter(status for status, _ in files)
 
-        return {
-            "new_files": new_files,
-            "modified_files": modified_files,
-            "deleted_files": deleted_files,
+        summary = {
+            "new_files": counts["A"],
+            "modified_files": counts["M"],
+            "deleted_files": counts["D"],
         }
+        return summary, files
+
+    def get_change_summary(self, spec_name: str) -> dict:
+        """Get a summary of changes in a worktree."""
+        return self.get_change_report(spec_name)[0]
 
     def cleanup_all(self) -> None:
         """Remove all worktrees and their branches."""
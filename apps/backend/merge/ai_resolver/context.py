@@ -71,6 +71,30 @@ class ConflictContext:
 
         return "\n".join(lines)
 
+    def resolution_key(self) -> tuple:
+        """
+        Key identifying the conflict by content alone.
+
+        Leaves out the file, location, task ids and intents so the same
+        conflicting change (e.g. an identical import block edited in several
+        files) maps to the same key wherever it occurs.
+        """
+        return (
+            self.language,
+            self.baseline_code,
+            tuple(
+                tuple(
+                    (
+                        change.change_type.value,
+                        change.content_before,
+                        change.content_after,
+                    )
+                    for change in changes
+                )
+                for _, _, changes in self.task_changes
+            ),
+        )
+
     @property
     def estimated_tokens(self) -> int:
         """Rough estimate of tokens in this context."""
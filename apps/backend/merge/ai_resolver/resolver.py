@@ -71,6 +71,10 @@ class AIResolver:
         self.max_context_tokens = max_context_tokens
         self._call_count = 0
         self._total_tokens = 0
+        # Resolutions by ConflictContext.resolution_key(), so a conflict seen
+        # earlier this session (e.g. the same import block in several files)
+        # skips the AI
+        self._resolution_cache: dict[tuple, str] = {}
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -178,6 +182,17 @@ class AIResolver:
         # Build context
         context = self.build_context(conflict, baseline_code, task_snapshots)
 
+        resolution_key = context.resolution_key()
+        cached_code = self._resolution_cache.get(resolution_key)
+        if cached_code is not None:
+            return MergeResult(
+                decision=MergeDecision.AI_MERGED,
+                file_path=conflict.file_path,
+                merged_content=cached_code,
+                conflicts_resolved=[conflict],
+                explanation=f"Reused AI resolution for identical conflict at {conflict.location}",
+            )
+
         # Check token limit
         if context.estimated_tokens > self.max_context_tokens:
             logger.warning(
@@ -206,6 +221,7 @@ class AIResolver:
             merged_code = extract_code_block(response, context.language)
 
             if merged_code:
+                self._resolution_cache[resolution_key] = merged_code
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED,
                     file_path=conflict.file_path,
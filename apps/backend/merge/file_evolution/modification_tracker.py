@@ -15,6 +15,8 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from core.git_blobs import GitBlobReader
+
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
@@ -211,86 +213,78 @@ class ModificationTracker:
             )
 
             processed_count = 0
-            for file_path in changed_files:
-                try:
-                    # Get the diff for this file (using merge-base for accurate task-only diff)
-                    diff_result = subprocess.run(
-                        ["git", "diff", f"{merge_base}..HEAD", "--", file_path],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    # Get content before (from merge-base - the point where task branched)
+            # One git cat-file process serves every merge-base read below
+            with GitBlobReader(worktree_path) as blobs:
+                for file_path in changed_files:
                     try:
-                        show_result = subprocess.run(
-                            ["git", "show", f"{merge_base}:{file_path}"],
+                        # Get the diff for this file (using merge-base for accurate task-only diff)
+                        diff_result = subprocess.run(
+                            ["git", "diff", f"{merge_base}..HEAD", "--", file_path],
                             cwd=worktree_path,
                             capture_output=True,
                             text=True,
                             check=True,
                         )
-                        old_content = show_result.stdout
-                    except subprocess.CalledProcessError:
-                        # File is new
-                        old_content = ""
-
-                    current_file = worktree_path / file_path
-                    if current_file.exists():
-                        try:
-                            new_content = current_file.read_text(encoding="utf-8")
-                        except UnicodeDecodeError:
-                            new_content = current_file.read_text(
-                                encoding="utf-8", errors="replace"
+
+                        # Get content before (from merge-base - the point where task branched)
+                        # None means the file is new
+                        old_content = blobs.read_decoded(merge_base, file_path) or ""
+
+                        current_file = worktree_path / file_path
+                        if current_file.exists():
+                            try:
+                                new_content = current_file.read_text(encoding="utf-8")
+                            except UnicodeDecodeError:
+                                new_content = current_file.read_text(
+                                    encoding="utf-8", errors="replace"
+                                )
+                        else:
+                            # File was deleted
+                            new_content = ""
+
+                        # Auto-create FileEvolution entry if not already tracked
+                        # This handles retroactive tracking when capture_baselines wasn't called
+                        rel_path = self.storage.get_relative_path(file_path)
+                        if rel_path not in evolutions:
+                            evolutions[rel_path] = FileEvolution(
+                                file_path=rel_path,
+                                baseline_commit=merge_base,
+                                baseline_captured_at=datetime.now(),
+                                baseline_content_hash=compute_content_hash(old_content),
+                                baseline_snapshot_path="",  # Not storing baseline file
+                                task_snapshots=[],
+                            )
+                            debug(
+                                MODULE,
+                                f"Auto-created evolution entry for {rel_path}",
+                                baseline_commit=merge_base[:8],
                             )
-                    else:
-                        # File was deleted
-                        new_content = ""
-
-                    # Auto-create FileEvolution entry if not already tracked
-                    # This handles retroactive tracking when capture_baselines wasn't called
-                    rel_path = self.storage.get_relative_path(file_path)
-                    if rel_path not in evolutions:
-                        evolutions[rel_path] = FileEvolution(
-                            file_path=rel_path,
-                            baseline_commit=merge_base,
-                            baseline_captured_at=datetime.now(),
-                            baseline_content_hash=compute_content_hash(old_content),
-                            baseline_snapshot_path="",  # Not storing baseline file
-                            task_snapshots=[],
-                        )
-                        debug(
-                            MODULE,
-                            f"Auto-created evolution entry for {rel_path}",
-                            baseline_commit=merge_base[:8],
-                        )
 
-                    # Determine if this file needs full semantic analysis
-                    # If analyze_only_files is provided, only analyze files in that set
-                    # Otherwise, analyze all files (backward compatible)
-                    skip_analysis = False
-                    if analyze_only_files is not None:
-                        skip_analysis = rel_path not in analyze_only_files
-
-                    # Record the modification
-                    self.record_modification(
-                        task_id=task_id,
-                        file_path=file_path,
-                        old_content=old_content,
-                        new_content=new_content,
-                        evolutions=evolutions,
-                        raw_diff=diff_result.stdout,
-                        skip_semantic_analysis=skip_analysis,
-                    )
-                    processed_count += 1
+                        # Determine if this file needs full semantic analysis
+                        # If analyze_only_files is provided, only analyze files in that set
+                        # Otherwise, analyze all files (backward compatible)
+                        skip_analysis = False
+                        if analyze_only_files is not None:
+                            skip_analysis = rel_path not in analyze_only_files
+
+                        # Record the modification
+                        self.record_modification(
+                            task_id=task_id,
+                            file_path=file_path,
+                            old_content=old_content,
+                            new_content=new_content,
+                            evolutions=evolutions,
+                            raw_diff=diff_result.stdout,
+                            skip_semantic_analysis=skip_analysis,
+                        )
+                        processed_count += 1
 
-                except subprocess.CalledProcessError as e:
-                    # Log error but continue with remaining files
-                    logger.warning(
-                        f"Failed to process {file_path} in refresh_from_git: {e}"
-                    )
-                    continue
+                    except subprocess.CalledProcessError as e:
+                        # Log error but continue with remaining files
+                        logger.warning(
+                            f"Failed to process {file_path} in refresh_from_git: {e}"
+                        )
+                        continue
 
             # Calculate how many files were fully analyzed vs just tracked
             if analyze_only_files is not None:
@@ -330,6 +330,40 @@ resolved code here
     return prompt
 
 
+def _split_common_lines(
+    main_lines: str, worktree_lines: str
+) -> tuple[list[str], str, str, list[str]]:
+    """
+    Peel the lines both sides of a conflict share off its start and end.
+
+    Returns (prefix_lines, main_diff, worktree_diff, suffix_lines). Identical
+    sides are returned untrimmed so there is still something to resolve.
+    """
+    if main_lines == worktree_lines:
+        return [], main_lines, worktree_lines, []
+
+    main = main_lines.split("\n")
+    worktree = worktree_lines.split("\n")
+    limit = min(len(main), len(worktree))
+
+    prefix = 0
+    while prefix < limit and main[prefix] == worktree[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and main[len(main) - 1 - suffix] == worktree[len(worktree) - 1 - suffix]
+    ):
+        suffix += 1
+
+    return (
+        main[:prefix],
+        "\n".join(main[prefix : len(main) - suffix]),
+        "\n".join(worktree[prefix : len(worktree) - suffix]),
+        main[len(main) - suffix :],
+    )
+
+
 def parse_conflict_markers(content: str) -> tuple[list[dict], list[str]]:
     """
     Parse a file with git conflict markers and extract conflict regions.
@@ -368,22 +402,26 @@ def parse_conflict_markers(content: str) -> tuple[list[dict], list[str]]:
         clean_before = content[last_end : match.start()]
         clean_sections.append(clean_before)
 
-        # Extract context (last 3 lines before conflict)
-        before_lines = clean_before.rstrip().split("\n")
-        context_before = (
-            "\n".join(before_lines[-3:])
-            if len(before_lines) >= 3
-            else clean_before.rstrip()
-        )
-
         # Extract the conflict content
         main_lines = match.group(1).rstrip("\n")
         worktree_lines = match.group(2).rstrip("\n")
 
+        # Lines both sides share at the edges of the region aren't in
+        # conflict - keep them out of the prompt and add them back on
+        # reassembly
+        prefix, main_lines, worktree_lines, suffix = _split_common_lines(
+            main_lines, worktree_lines
+        )
+
+        # Extract context (last 3 lines before conflict) - split off only
+        # those instead of every line of the section
+        before_lines = clean_before.rstrip().rsplit("\n", 3) + prefix
+        context_before = "\n".join(before_lines[-3:])
+
         # Get context after (first 3 lines after conflict)
         after_start = match.end()
         after_content = content[after_start : after_start + 500]  # Look ahead 500 chars
-        after_lines = after_content.split("\n")[:3]
+        after_lines = (suffix + after_content.split("\n", 3))[:3]
         context_after = "\n".join(after_lines)
 
         conflicts.append(
@@ -395,6 +433,8 @@ def parse_conflict_markers(content: str) -> tuple[list[dict], list[str]]:
                 "worktree_lines": worktree_lines,
                 "context_before": context_before,
                 "context_after": context_after,
+                "common_prefix": prefix,
+                "common_suffix": suffix,
             }
         )
 
@@ -436,10 +476,19 @@ def reassemble_with_resolutions(
         # Add the resolution (or keep conflict if no resolution)
         conflict_id = conflict["id"]
         if conflict_id in resolutions:
-            result_parts.append(resolutions[conflict_id])
+            resolved = resolutions[conflict_id]
         else:
             # Fallback: prefer feature branch version if no resolution
-            result_parts.append(conflict["worktree_lines"])
+            resolved = conflict["worktree_lines"]
+
+        # Restore the lines parse_conflict_markers trimmed as common to both
+        # sides (kept as lists so shared blank lines survive)
+        lines = [
+            *conflict.get("common_prefix", []),
+            *([resolved] if resolved else []),
+            *conflict.get("common_suffix", []),
+        ]
+        result_parts.append("\n".join(lines))
 
         last_end = conflict["end"]
 
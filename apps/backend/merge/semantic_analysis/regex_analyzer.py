@@ -35,11 +35,32 @@ def analyze_with_regex(
     before_normalized = before.replace("\r\n", "\n").replace("\r", "\n")
     after_normalized = after.replace("\r\n", "\n").replace("\r", "\n")
 
+    # Unchanged content (e.g. only line endings differed) has no changes to
+    # find - skip the diff and pattern scans entirely
+    if before_normalized == after_normalized:
+        return FileAnalysis(file_path=file_path, changes=changes)
+
+    # Lines shared at the start and end can't be part of any change. Trimming
+    # them first leaves difflib's pure-Python matcher only the region that
+    # actually changed, which for a small edit to a big file is a tiny slice.
+    before_lines = before_normalized.splitlines(keepends=True)
+    after_lines = after_normalized.splitlines(keepends=True)
+    limit = min(len(before_lines), len(after_lines))
+    prefix = 0
+    while prefix < limit and before_lines[prefix] == after_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and before_lines[-1 - suffix] == after_lines[-1 - suffix]
+    ):
+        suffix += 1
+
     # Get a unified diff
     diff = list(
         difflib.unified_diff(
-            before_normalized.splitlines(keepends=True),
-            after_normalized.splitlines(keepends=True),
+            before_lines[prefix : len(before_lines) - suffix],
+            after_lines[prefix : len(after_lines) - suffix],
             lineterm="",
         )
     )
@@ -52,9 +73,14 @@ def analyze_with_regex(
     for line in diff:
         if line.startswith("@@"):
             # Parse the line numbers
-            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)", line)
+            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)(,0)?", line)
             if match:
-                current_line = int(match.group(1))
+                # Hunk positions are relative to the trimmed slice. An empty
+                # range names the line before it, which the full diff's
+                # context lines would have stepped past.
+                current_line = int(match.group(1)) + prefix
+                if match.group(2) and (prefix or suffix):
+                    current_line += 1
         elif line.startswith("+") and not line.startswith("+++"):
             added_lines.append((current_line, line[1:]))
             current_line += 1
@@ -12,8 +12,8 @@ The spec creation process has mandatory checkpoints:
 4. Implementation plan (implementation_plan.json with valid schema)
 """
 
-from .auto_fix import auto_fix_plan
+from .auto_fix import auto_fix_plan, auto_fix_plans
 from .models import ValidationResult
 from .spec_validator import SpecValidator
 
-__all__ = ["SpecValidator", "ValidationResult", "auto_fix_plan"]
+__all__ = ["SpecValidator", "ValidationResult", "auto_fix_plan", "auto_fix_plans"]
@@ -7,12 +7,118 @@ Automated fixes for common implementation plan issues.
 
 import json
 import logging
+import math
+import os
 import re
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.file_utils import atomic_write
 from core.plan_normalization import normalize_subtask_aliases
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Maps every known status spelling (canonical values plus common non-standard
+# variants produced by LLMs or legacy tooling) to its schema-compliant value.
+# Values are interned so every normalized subtask shares one string object
+# per status.
+_STATUS_MAP: dict[str, str] = {
+    variant: sys.intern(canonical)
+    for variant, canonical in {
+        "pending": "pending",
+        "in_progress": "in_progress",
+        "completed": "completed",
+        "blocked": "blocked",
+        "failed": "failed",
+        "not_started": "pending",
+        "not started": "pending",
+        "todo": "pending",
+        "to_do": "pending",
+        "backlog": "pending",
+        "in-progress": "in_progress",
+        "inprogress": "in_progress",
+        "working": "in_progress",
+        "done": "completed",
+        "complete": "completed",
+        "completed_successfully": "completed",
+    }.items()
+}
+_DEFAULT_STATUS = _STATUS_MAP["pending"]
+
+# Schema-compliant status values; subtasks already using one skip normalization.
+_CANONICAL_STATUSES = frozenset(
+    {"pending", "in_progress", "completed", "blocked", "failed"}
+)
+
+# Plans already known to need no fixes, keyed by path -> (st_ino, st_mtime_ns,
+# st_size). A modified (or atomically replaced) file gets a new stat signature,
+# so stale entries never match.
+_CLEAN_PLAN_CACHE: dict[str, tuple[int, int, int]] = {}
+_CLEAN_PLAN_CACHE_LOCK = threading.Lock()
+
+# On filesystems with coarse mtime resolution a same-size rewrite within one
+# tick keeps the old signature. Like git's racy-clean rule, plans modified this
+# recently are not cached, so they are checked again next time.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Sentinel distinguishing a missing key from an explicit null value
+_MISSING = object()
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    orjson rejects NaN and Infinity, which json accepts, so anything orjson
+    refuses is parsed again with json before it is treated as invalid.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Return True if any float nested in ``data`` is NaN or infinite."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, list):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a plan to UTF-8 JSON bytes with 2-space indentation.
+
+    orjson refuses some values json writes (e.g. integers past 64 bits) and
+    writes NaN and Infinity as null, so those plans are written with json.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # Only a plan that came out with a null can have lost a NaN
+            if b"null" not in encoded or not _has_non_finite(data):
+                return encoded
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def _repair_json_syntax(content: str) -> str | None:
     """
@@ -31,8 +137,10 @@ def _repair_json_syntax(content: str) -> str | None:
     # Implementation plans are typically <100KB; 1MB provides ample headroom.
     max_content_size = 1024 * 1024  # 1 MB
     if len(content) > max_content_size:
-        logging.warning(
-            f"JSON repair skipped: content size {len(content)} exceeds limit {max_content_size}"
+        logger.warning(
+            "JSON repair skipped: content size %d exceeds limit %d",
+            len(content),
+            max_content_size,
         )
         return None
 
@@ -101,22 +209,81 @@ def _repair_json_syntax(content: str) -> str | None:
 def _normalize_status(value: object) -> str:
     """Normalize common status variants to schema-compliant values."""
     if not isinstance(value, str):
-        return "pending"
+        return _DEFAULT_STATUS
 
-    normalized = value.strip().lower()
-    if normalized in {"pending", "in_progress", "completed", "blocked", "failed"}:
-        return normalized
+    # Unknown values fall back to pending to prevent deadlocks in execution
+    return _STATUS_MAP.get(value.strip().lower(), _DEFAULT_STATUS)
 
-    # Common non-standard variants produced by LLMs or legacy tooling
-    if normalized in {"not_started", "not started", "todo", "to_do", "backlog"}:
-        return "pending"
-    if normalized in {"in-progress", "inprogress", "working"}:
-        return "in_progress"
-    if normalized in {"done", "complete", "completed_successfully"}:
-        return "completed"
 
-    # Unknown values fall back to pending to prevent deadlocks in execution
-    return "pending"
+def _coerce_str_phase(value: str) -> int | None:
+    stripped = value.strip()
+    return int(stripped) if stripped.isdigit() else None
+
+
+# phase_id coercion keyed on exact type: bool is its own type, so True/False
+# never take the int branch.
+_PHASE_COERCE: dict[type, Callable[[Any], int | None]] = {
+    int: lambda v: v,
+    float: lambda v: int(v) if v.is_integer() else None,
+    str: _coerce_str_phase,
+}
+
+
+def _coerce_phase_num(value: object) -> int | None:
+    """Return the integer phase number encoded by a ``phase_id`` value, if any."""
+    coerce = _PHASE_COERCE.get(type(value))
+    return coerce(value) if coerce is not None else None
+
+
+def _is_nonblank_str(value: object) -> bool:
+    return type(value) is str and bool(value.strip())
+
+
+def _is_canonical(plan: object) -> bool:
+    """Return True if ``plan`` is already in the shape auto-fix produces.
+
+    Every condition here is at least as strict as the corresponding fix in
+    ``_fix_plan_bytes``, so a True result guarantees the full pass would not
+    change anything. Anything unusual falls back to the full pass.
+    """
+    if not isinstance(plan, dict):
+        return False
+    phases = plan.get("phases")
+    if (
+        not isinstance(phases, list)
+        or "feature" not in plan
+        or "workflow_type" not in plan
+    ):
+        return False
+
+    for phase in phases:
+        if not isinstance(phase, dict):
+            return False
+        subtasks = phase.get("subtasks")
+        if (
+            "name" not in phase
+            or "phase" not in phase
+            or not isinstance(subtasks, list)
+            or ("chunks" in phase and not subtasks)
+        ):
+            return False
+        depends_on = phase.get("depends_on", [])
+        if not isinstance(depends_on, list) or not all(
+            type(d) is str and d == d.strip() for d in depends_on
+        ):
+            return False
+        for subtask in subtasks:
+            if not isinstance(subtask, dict):
+                return False
+            status = subtask.get("status")
+            if (
+                type(status) is not str
+                or status not in _CANONICAL_STATUSES
+                or not _is_nonblank_str(subtask.get("id"))
+                or not _is_nonblank_str(subtask.get("description"))
+            ):
+                return False
+    return True
 
 
 def auto_fix_plan(spec_dir: Path) -> bool:
@@ -133,33 +300,95 @@ def auto_fix_plan(spec_dir: Path) -> bool:
     """
     plan_file = spec_dir / "implementation_plan.json"
 
-    if not plan_file.exists():
+    try:
+        st = plan_file.stat()
+    except OSError:
         return False
 
-    plan = None
+    cache_key = str(plan_file)
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _CLEAN_PLAN_CACHE_LOCK:
+        if _CLEAN_PLAN_CACHE.get(cache_key) == signature:
+            return False
+
+    try:
+        raw = plan_file.read_bytes()
+    except OSError:
+        return False
+
+    content = _fix_plan_bytes(plan_file, raw)
+    if content is None or content == raw:
+        # Nothing to fix (or normalization round-tripped to the exact bytes on
+        # disk). The result depends only on file contents, so remember it
+        # until the file changes.
+        if time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_WINDOW_NS:
+            with _CLEAN_PLAN_CACHE_LOCK:
+                _CLEAN_PLAN_CACHE[cache_key] = signature
+        return False
+
+    try:
+        # Use atomic write to prevent file corruption if interrupted
+        with atomic_write(plan_file, "wb", encoding=None) as f:
+            f.write(content)
+    except OSError:
+        return False
+    logger.info("Auto-fixed: %s", plan_file)
+    return True
+
+
+def auto_fix_plans(
+    spec_dirs: Iterable[Path], max_workers: int | None = None
+) -> dict[Path, bool]:
+    """Run auto_fix_plan over many spec directories in parallel.
+
+    Each plan is independent and the work is CPU-bound JSON parsing and
+    normalization, so directories are spread across a process pool.
+
+    Args:
+        spec_dirs: Spec directories to fix
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Mapping of each spec directory to its auto_fix_plan result
+    """
+    dirs = list(spec_dirs)
+    if len(dirs) <= 1:
+        return {spec_dir: auto_fix_plan(spec_dir) for spec_dir in dirs}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(dirs))
+    chunksize = max(1, len(dirs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(auto_fix_plan, dirs, chunksize=chunksize)
+        return dict(zip(dirs, results))
+
+
+def _fix_plan_bytes(plan_file: Path, raw: bytes) -> bytes | None:
+    """Normalize the plan parsed from ``raw``.
+
+    Returns:
+        The re-encoded plan if any fixes were applied, None otherwise
+    """
+    plan: dict[str, Any] | None = None
     json_repaired = False
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            content = f.read()
-        plan = json.loads(content)
+        plan = _loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
-        # Attempt JSON syntax repair
+        # Attempt JSON syntax repair on the bytes already read
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                content = f.read()
-            repaired = _repair_json_syntax(content)
+            repaired = _repair_json_syntax(raw.decode("utf-8"))
             if repaired:
-                plan = json.loads(repaired)
+                plan = _loads(repaired)
                 json_repaired = True
-                logging.info(f"JSON syntax repaired: {plan_file}")
+                logger.info("JSON syntax repaired: %s", plan_file)
         except Exception as e:
-            logging.warning(f"JSON repair attempt failed for {plan_file}: {e}")
-    except OSError:
-        return False
+            logger.warning("JSON repair attempt failed for %s: %s", plan_file, e)
 
     if plan is None:
-        return False
+        return None
+
+    if not json_repaired and _is_canonical(plan):
+        return None
 
     fixed = False
 
@@ -167,13 +396,12 @@ def auto_fix_plan(spec_dir: Path) -> bool:
     if "phases" not in plan and (
         isinstance(plan.get("subtasks"), list) or isinstance(plan.get("chunks"), list)
     ):
-        subtasks = plan.get("subtasks") or plan.get("chunks") or []
         plan["phases"] = [
             {
                 "id": "1",
                 "phase": 1,
                 "name": "Phase 1",
-                "subtasks": subtasks,
+                "subtasks": plan.get("subtasks") or plan.get("chunks") or [],
             }
         ]
         plan.pop("subtasks", None)
@@ -194,97 +422,90 @@ def auto_fix_plan(spec_dir: Path) -> bool:
         fixed = True
 
     # Fix phases
-    for i, phase in enumerate(plan.get("phases", [])):
-        # Normalize common phase field aliases
-        if "name" not in phase and "title" in phase:
-            phase["name"] = phase.get("title")
-            fixed = True
+    phases: list[dict[str, Any]] = plan.get("phases", [])
+    for i, phase in enumerate(phases):
+        phase_get = phase.get
 
-        if "phase" not in phase and "phase_id" in phase:
-            phase_id = phase.get("phase_id")
-            phase_id_str = str(phase_id).strip() if phase_id is not None else ""
-            phase_num: int | None = None
-            if isinstance(phase_id, int) and not isinstance(phase_id, bool):
-                phase_num = phase_id
-            elif (
-                isinstance(phase_id, float)
-                and not isinstance(phase_id, bool)
-                and phase_id.is_integer()
-            ):
-                phase_num = int(phase_id)
-            elif isinstance(phase_id, str) and phase_id_str.isdigit():
-                phase_num = int(phase_id_str)
+        # Normalize common phase field aliases
+        if "name" not in phase:
+            title = phase_get("title", _MISSING)
+            if title is not _MISSING:
+                phase["name"] = title
+                fixed = True
 
+        if "phase" not in phase:
+            # A missing phase_id and an explicit null both read back as None
+            phase_id = phase_get("phase_id")
+            phase_num = _coerce_phase_num(phase_id)
             if phase_num is not None:
                 if "id" not in phase:
                     phase["id"] = str(phase_num)
-                    fixed = True
                 phase["phase"] = phase_num
-                fixed = True
-            elif "id" not in phase and phase_id is not None:
-                phase["id"] = phase_id_str
-                fixed = True
-
-        if "phase" not in phase:
-            phase["phase"] = i + 1
+            else:
+                if "id" not in phase and phase_id is not None:
+                    phase["id"] = str(phase_id).strip()
+                phase["phase"] = i + 1
             fixed = True
 
-        depends_on_raw = phase.get("depends_on", [])
-        if isinstance(depends_on_raw, list):
-            normalized_depends_on = [
-                str(d).strip() for d in depends_on_raw if d is not None
-            ]
-        elif depends_on_raw is None:
-            normalized_depends_on = []
+        depends_on_raw = phase_get("depends_on", [])
+        if isinstance(depends_on_raw, list) and all(
+            type(d) is str and d == d.strip() for d in depends_on_raw
+        ):
+            # Already a list of clean strings - nothing to rebuild
+            pass
         else:
-            normalized_depends_on = [str(depends_on_raw).strip()]
-        if normalized_depends_on != depends_on_raw:
-            phase["depends_on"] = normalized_depends_on
-            fixed = True
+            if isinstance(depends_on_raw, list):
+                normalized_depends_on = [
+                    str(d).strip() for d in depends_on_raw if d is not None
+                ]
+            elif depends_on_raw is None:
+                normalized_depends_on = []
+            else:
+                normalized_depends_on = [str(depends_on_raw).strip()]
+            if normalized_depends_on != depends_on_raw:
+                phase["depends_on"] = normalized_depends_on
+                fixed = True
 
         if "name" not in phase:
             phase["name"] = f"Phase {i + 1}"
             fixed = True
 
-        if "subtasks" not in phase:
-            phase["subtasks"] = phase.get("chunks", [])
-            fixed = True
-        elif "chunks" in phase and not phase.get("subtasks"):
-            # If subtasks exists but is empty, fall back to chunks if present
-            phase["subtasks"] = phase.get("chunks", [])
+        subtasks: list[dict[str, Any]] | None = phase_get("subtasks")
+        if "subtasks" not in phase or ("chunks" in phase and not subtasks):
+            # Fall back to chunks when subtasks is missing, or empty while
+            # chunks is present
+            subtasks = phase["subtasks"] = phase_get("chunks", [])
             fixed = True
 
-        # Fix subtasks
-        for j, subtask in enumerate(phase.get("subtasks", [])):
+        if not subtasks:
+            continue
+
+        # Fix subtasks. normalize_subtask_aliases returns a fresh copy; missing
+        # fields are filled in on that copy, which replaces the original entry
+        # only if something changed.
+        for j, subtask in enumerate(subtasks):
             normalized, changed = normalize_subtask_aliases(subtask)
-            if changed:
-                subtask.update(normalized)
-                fixed = True
 
-            if "id" not in subtask:
-                subtask["id"] = f"subtask-{i + 1}-{j + 1}"
-                fixed = True
+            if "id" not in normalized:
+                normalized["id"] = f"subtask-{i + 1}-{j + 1}"
+                changed = True
 
-            if "description" not in subtask:
-                subtask["description"] = "No description"
-                fixed = True
+            if "description" not in normalized:
+                normalized["description"] = "No description"
+                changed = True
+
+            status = normalized.get("status", _MISSING)
+            if status is _MISSING:
+                normalized["status"] = _DEFAULT_STATUS
+                changed = True
+            elif not isinstance(status, str) or status not in _CANONICAL_STATUSES:
+                normalized["status"] = _normalize_status(status)
+                changed = True
 
-            if "status" not in subtask:
-                subtask["status"] = "pending"
+            if changed:
+                subtasks[j] = normalized
                 fixed = True
-            else:
-                normalized_status = _normalize_status(subtask.get("status"))
-                if subtask.get("status") != normalized_status:
-                    subtask["status"] = normalized_status
-                    fixed = True
 
     if fixed or json_repaired:
-        try:
-            # Use atomic write to prevent file corruption if interrupted
-            write_json_atomic(plan_file, plan, indent=2, ensure_ascii=False)
-        except OSError:
-            return False
-        if fixed:
-            logging.info(f"Auto-fixed: {plan_file}")
-
-    return fixed or json_repaired
+        return _dumps(plan)
+    return None
@@ -9,12 +9,14 @@ execution to get stuck because no "pending" subtasks are detected.
 
 import importlib
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
 from core.progress import get_next_subtask
 from prompt_generator import generate_planner_prompt
-from spec.validate_pkg import SpecValidator, auto_fix_plan
+from spec.validate_pkg import SpecValidator, auto_fix_plan, auto_fix_plans
 
 
 def _write_plan(path: Path, data: dict) -> None:
@@ -266,6 +268,145 @@ def test_auto_fix_plan_sets_phase_from_numeric_phase_id_even_with_existing_id(
     assert SpecValidator(spec_dir).validate_implementation_plan().valid is True
 
 
+def test_auto_fix_plan_normalizes_status_variants(spec_dir: Path):
+    plan = {
+        "feature": "Test feature",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": "1",
+                "phase": 1,
+                "name": "Phase 1",
+                "depends_on": [],
+                "subtasks": [
+                    {"id": "1.1", "description": "a", "status": " Done "},
+                    {"id": "1.2", "description": "b", "status": "in-progress"},
+                    {"id": "1.3", "description": "c", "status": "blocked"},
+                    {"id": "1.4", "description": "d", "status": ["bogus"]},
+                    {"id": "1.5", "description": "e", "status": "mystery"},
+                ],
+            }
+        ],
+    }
+    plan_path = spec_dir / "implementation_plan.json"
+    _write_plan(plan_path, plan)
+
+    assert auto_fix_plan(spec_dir) is True
+
+    loaded = json.loads(plan_path.read_text(encoding="utf-8"))
+    statuses = [s["status"] for s in loaded["phases"][0]["subtasks"]]
+    assert statuses == ["completed", "in_progress", "blocked", "pending", "pending"]
+
+    # A second pass over the now-canonical plan has nothing to fix
+    assert auto_fix_plan(spec_dir) is False
+
+
+def test_auto_fix_plan_fixes_plan_with_nan(spec_dir: Path):
+    plan = {
+        "feature": "Test feature",
+        "workflow_type": "feature",
+        "estimate": float("nan"),
+        "phases": [
+            {
+                "id": "1",
+                "phase": 1,
+                "name": "Phase 1",
+                "depends_on": [],
+                "subtasks": [{"id": "1.1", "description": "a", "status": "todo"}],
+            }
+        ],
+    }
+    plan_path = spec_dir / "implementation_plan.json"
+    _write_plan(plan_path, plan)
+    assert "NaN" in plan_path.read_text(encoding="utf-8")
+
+    assert auto_fix_plan(spec_dir) is True
+
+    # NaN survives the rewrite instead of turning into null
+    content = plan_path.read_text(encoding="utf-8")
+    assert '"estimate": NaN' in content
+    loaded = json.loads(content)
+    assert loaded["phases"][0]["subtasks"][0]["status"] == "pending"
+
+
+def test_auto_fix_plan_skips_reparse_of_unchanged_clean_plan(
+    spec_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from spec.validate_pkg import auto_fix
+
+    plan = {
+        "feature": "Test feature",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": "1",
+                "phase": 1,
+                "name": "Phase 1",
+                "depends_on": [],
+                "subtasks": [{"id": "1.1", "description": "a", "status": "pending"}],
+            }
+        ],
+    }
+    plan_path = spec_dir / "implementation_plan.json"
+    _write_plan(plan_path, plan)
+
+    calls = []
+    original = auto_fix._fix_plan_bytes
+    monkeypatch.setattr(
+        auto_fix,
+        "_fix_plan_bytes",
+        lambda path, raw: calls.append(path) or original(path, raw),
+    )
+
+    # A plan written within the racy window is never cached, since a
+    # same-size rewrite in the same mtime tick would look unchanged
+    assert auto_fix_plan(spec_dir) is False
+    assert auto_fix_plan(spec_dir) is False
+    assert len(calls) == 2
+
+    settled = time.time_ns() - 10_000_000_000
+    os.utime(plan_path, ns=(settled, settled))
+    assert auto_fix_plan(spec_dir) is False
+    assert auto_fix_plan(spec_dir) is False
+    assert len(calls) == 3
+
+    # Rewriting the file invalidates the cached result
+    plan["phases"][0]["subtasks"][0]["status"] = "todo"
+    _write_plan(plan_path, plan)
+    assert auto_fix_plan(spec_dir) is True
+    assert len(calls) == 4
+
+
+def test_auto_fix_plans_fixes_each_spec_dir(tmp_path: Path):
+    clean = {
+        "feature": "Clean",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": "1",
+                "phase": 1,
+                "name": "Phase 1",
+                "subtasks": [{"id": "1.1", "description": "a", "status": "pending"}],
+            }
+        ],
+    }
+    dirty = {"subtasks": [{"subtask_id": "1.1", "title": "a", "status": "todo"}]}
+
+    spec_dirs = []
+    for name, plan in [("001-clean", clean), ("002-dirty", dirty), ("003-empty", None)]:
+        spec_dir = tmp_path / name
+        spec_dir.mkdir()
+        if plan is not None:
+            _write_plan(spec_dir / "implementation_plan.json", plan)
+        spec_dirs.append(spec_dir)
+
+    results = auto_fix_plans(spec_dirs, max_workers=2)
+
+    assert results == {spec_dirs[0]: False, spec_dirs[1]: True, spec_dirs[2]: False}
+    fixed = json.loads((spec_dirs[1] / "implementation_plan.json").read_text())
+    assert fixed["phases"][0]["subtasks"][0]["status"] == "pending"
+
+
 @pytest.mark.asyncio
 async def test_planner_session_does_not_trigger_post_session_processing_on_retry(
     temp_git_repo: Path, monkeypatch: pytest.MonkeyPatch
@@ -208,6 +208,49 @@ class TestStatsTracking:
         stats = mock_ai_resolver.stats
         assert stats["calls_made"] == 3
 
+    def test_identical_conflict_reuses_resolution(self):
+        """The same conflicting change in another file doesn't call the AI again."""
+        from merge import AIResolver
+
+        resolver = AIResolver(
+            ai_call_fn=lambda system, user: "```python\nimport os\nimport sys\n```"
+        )
+
+        def resolve(file_path: str, location: str, baseline: str):
+            change = SemanticChange(
+                change_type=ChangeType.ADD_IMPORT,
+                target="sys",
+                location=location,
+                line_start=1,
+                line_end=1,
+                content_after="import sys",
+            )
+            snapshot = TaskSnapshot(
+                task_id=f"task-{file_path}",
+                task_intent=f"Edit {file_path}",
+                started_at=datetime.now(),
+                semantic_changes=[change],
+            )
+            conflict = ConflictRegion(
+                file_path=file_path,
+                location=location,
+                tasks_involved=[snapshot.task_id],
+                change_types=[ChangeType.ADD_IMPORT],
+                severity=ConflictSeverity.MEDIUM,
+                can_auto_merge=False,
+            )
+            return resolver.resolve_conflict(conflict, baseline, [snapshot])
+
+        first = resolve("src/a.py", "file_top", "import os")
+        second = resolve("src/b.py", "imports", "import os")
+        resolve("src/c.py", "file_top", "import json")
+
+        assert second.decision == MergeDecision.AI_MERGED
+        assert second.file_path == "src/b.py"
+        assert second.merged_content == first.merged_content
+        assert second.ai_calls_made == 0
+        assert resolver.stats["calls_made"] == 2
+
 
 class TestAIMergeRetryMechanism:
     """Tests for AI merge retry mechanism with fallback (ACS-194)."""
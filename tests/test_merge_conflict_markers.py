@@ -21,6 +21,7 @@ from merge.prompts import (
     extract_conflict_resolutions,
     reassemble_with_resolutions,
     build_conflict_only_prompt,
+    _split_common_lines,
 )
 
 
@@ -292,6 +293,124 @@ after
         assert 'feature version' in result
         assert '<<<<<<' not in result
 
+    def test_common_lines_trimmed_and_restored(self):
+        """Lines shared by both sides stay out of the conflict but survive reassembly."""
+        original = '''before
+<<<<<<< HEAD
+def foo():
+
+    return "main"
+    # end
+=======
+def foo():
+
+    return "feature"
+    # end
+>>>>>>> feature
+after
+'''
+        conflicts, _ = parse_conflict_markers(original)
+
+        assert conflicts[0]['main_lines'] == '    return "main"'
+        assert conflicts[0]['worktree_lines'] == '    return "feature"'
+        assert conflicts[0]['context_before'] == 'before\ndef foo():\n'
+        assert conflicts[0]['context_after'].startswith('    # end\nafter')
+
+        result = reassemble_with_resolutions(
+            original, conflicts, {'CONFLICT_1': '    return "merged"'}
+        )
+
+        assert result.startswith('''before
+def foo():
+
+    return "merged"
+    # end''')
+        assert '<<<<<<<' not in result
+
+
+class TestCommonLineSplitting:
+    """Tests for trimming lines both sides share off a conflict."""
+
+    def test_split_empty_side(self):
+        """A side with no lines shares nothing, so the other side is kept whole."""
+        assert _split_common_lines("", "new line") == ([], "", "new line", [])
+        assert _split_common_lines("old line", "") == ([], "old line", "", [])
+
+    def test_split_side_is_prefix_of_other(self):
+        """When one side is a prefix of the other only the extra lines conflict."""
+        assert _split_common_lines("a\nb", "a\nb\nc") == (["a", "b"], "", "c", [])
+        assert _split_common_lines("b\nc", "a\nb\nc") == ([], "", "a", ["b", "c"])
+
+    def test_split_shared_blank_lines(self):
+        """Blank lines at the edges count as shared lines and are kept as such."""
+        assert _split_common_lines("\nmain\n", "\nfeature\n") == (
+            [""], "main", "feature", [""]
+        )
+
+    def test_empty_side_reassembles_from_worktree(self):
+        """A conflict that only adds lines falls back to the added lines."""
+        original = """before
+<<<<<<< HEAD
+=======
+new line
+>>>>>>> feature
+after
+"""
+        conflicts, _ = parse_conflict_markers(original)
+
+        assert conflicts[0]["main_lines"] == ""
+        assert conflicts[0]["worktree_lines"] == "new line"
+
+        result = reassemble_with_resolutions(original, conflicts, {})
+
+        assert result.startswith("before\nnew line")
+        assert "<<<<<<<" not in result
+
+    def test_shared_blank_lines_survive_reassembly(self):
+        """A blank line common to both sides is restored around the resolution."""
+        original = """before
+<<<<<<< HEAD
+
+main
+=======
+
+feature
+>>>>>>> feature
+after
+"""
+        conflicts, _ = parse_conflict_markers(original)
+
+        assert conflicts[0]["common_prefix"] == [""]
+
+        result = reassemble_with_resolutions(
+            original, conflicts, {"CONFLICT_1": "merged"}
+        )
+
+        assert result.startswith("before\n\nmerged")
+
+    def test_missing_resolution_keeps_common_lines(self):
+        """Without a resolution, worktree_lines is used with the shared lines."""
+        original = """before
+<<<<<<< HEAD
+a
+b
+=======
+a
+b
+c
+>>>>>>> feature
+after
+"""
+        conflicts, _ = parse_conflict_markers(original)
+
+        assert conflicts[0]["main_lines"] == ""
+        assert conflicts[0]["worktree_lines"] == "c"
+
+        result = reassemble_with_resolutions(original, conflicts, {})
+
+        assert result.startswith("before\na\nb\nc")
+        assert "=======" not in result
+
 
 class TestBuildConflictOnlyPrompt:
     """Tests for building conflict-only prompts."""
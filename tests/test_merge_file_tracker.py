@@ -15,6 +15,7 @@ Covers:
 - Evolution summaries
 """
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -211,6 +212,59 @@ class TestTaskCleanup:
         # Baseline might still exist depending on implementation
 
 
+class TestRefreshFromGit:
+    """Tests for rebuilding task snapshots from a worktree's git history."""
+
+    def test_refresh_reads_merge_base_through_one_reader(
+        self, file_tracker, temp_project, monkeypatch
+    ):
+        """Every changed file's "before" content comes from one shared blob reader."""
+        from merge.file_evolution import modification_tracker
+        from merge.types import compute_content_hash
+
+        main_branch = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=temp_project, capture_output=True, text=True
+        ).stdout.strip()
+        subprocess.run(
+            ["git", "checkout", "-b", "task"], cwd=temp_project, capture_output=True
+        )
+        (temp_project / "src" / "utils.py").write_text(
+            SAMPLE_PYTHON_WITH_NEW_FUNCTION, encoding="utf-8"
+        )
+        (temp_project / "src" / "new.py").write_text("x = 1\n", encoding="utf-8")
+        subprocess.run(["git", "add", "."], cwd=temp_project, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Task changes"], cwd=temp_project, capture_output=True
+        )
+
+        readers = []
+        real_reader = modification_tracker.GitBlobReader
+
+        def counting_reader(*args, **kwargs):
+            reader = real_reader(*args, **kwargs)
+            readers.append(reader)
+            return reader
+
+        monkeypatch.setattr(modification_tracker, "GitBlobReader", counting_reader)
+
+        file_tracker.refresh_from_git(
+            "task-001", temp_project, target_branch=main_branch, analyze_only_files=set()
+        )
+
+        assert len(readers) == 1
+        before = {
+            path: file_tracker.get_file_evolution(path)
+            .get_task_snapshot("task-001")
+            .content_hash_before
+            for path in ("src/utils.py", "src/new.py")
+        }
+        assert before == {
+            "src/utils.py": compute_content_hash(SAMPLE_PYTHON_MODULE),
+            "src/new.py": compute_content_hash(""),
+        }
+
+
 class TestEvolutionSummary:
     """Tests for evolution summary generation."""
 
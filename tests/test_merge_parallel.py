@@ -184,6 +184,143 @@ class TestSimple3WayMerge:
         assert results[0].was_auto_merged is True
         assert "print('main')" in results[0].merged_content
 
+    def test_non_overlapping_changes_git_merge(self, tmp_path):
+        """When both sides changed different lines, git merges them without AI."""
+        import asyncio
+
+        body = "\n\n\ndef a():\n    pass\n\n\ndef b():\n    {}\n"
+        task = ParallelMergeTask(
+            file_path="src/test.py",
+            main_content="import os" + body.format("pass"),  # Changed import
+            worktree_content="import sys" + body.format("return 1"),  # Changed b()
+            base_content="import sys" + body.format("pass"),
+            spec_name="001-both-changed",
+            project_dir=tmp_path,
+        )
+
+        results = asyncio.run(_run_parallel_merges([task], tmp_path))
+        assert len(results) == 1
+        assert results[0].success is True
+        assert results[0].was_auto_merged is True
+        assert results[0].merged_content == "import os" + body.format("return 1")
+
+    def test_cached_ai_merge_is_reused(self, tmp_path):
+        """A previously stored AI merge for identical inputs skips the AI."""
+        import asyncio
+
+        from core.workspace import _workspace_module
+
+        task = ParallelMergeTask(
+            file_path="src/test.py",
+            main_content="x = 'main'\n",
+            worktree_content="x = 'worktree'\n",
+            base_content="x = 'base'\n",
+            spec_name="001-cached",
+            project_dir=tmp_path,
+        )
+        cache_path = _workspace_module._ai_merge_cache_path(task)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("x = 'merged'\n", encoding="utf-8")
+
+        results = asyncio.run(_run_parallel_merges([task], tmp_path))
+        assert results[0].success is True
+        assert results[0].was_auto_merged is False
+        assert results[0].merged_content == "x = 'merged'\n"
+
+    def test_ai_merge_cache_key_distinguishes_missing_base(self, tmp_path):
+        """A missing base never shares a cache entry with any literal base."""
+        from core.workspace import _workspace_module
+
+        def cache_path(base_content):
+            return _workspace_module._ai_merge_cache_path(
+                ParallelMergeTask(
+                    file_path="src/test.py",
+                    main_content="a",
+                    worktree_content="b",
+                    base_content=base_content,
+                    spec_name="001-key",
+                    project_dir=tmp_path,
+                )
+            )
+
+        paths = {cache_path(None), cache_path("\0"), cache_path("")}
+        assert len(paths) == 3
+
+    def test_ai_merge_cache_key_includes_spec_name(self, tmp_path):
+        """The spec name is part of the prompt, so specs never share a merge."""
+        from core.workspace import _workspace_module
+
+        def cache_path(spec_name):
+            return _workspace_module._ai_merge_cache_path(
+                ParallelMergeTask(
+                    file_path="src/test.py",
+                    main_content="a",
+                    worktree_content="b",
+                    base_content="c",
+                    spec_name=spec_name,
+                    project_dir=tmp_path,
+                )
+            )
+
+        assert cache_path("001-first") != cache_path("002-second")
+
+    def test_ai_merge_cache_key_includes_version(self, tmp_path, monkeypatch):
+        """Bumping the cache version invalidates earlier merges."""
+        from core.workspace import _workspace_module
+
+        task = ParallelMergeTask(
+            file_path="src/test.py",
+            main_content="a",
+            worktree_content="b",
+            base_content="c",
+            spec_name="001-version",
+            project_dir=tmp_path,
+        )
+        before = _workspace_module._ai_merge_cache_path(task)
+        monkeypatch.setattr(
+            _workspace_module,
+            "AI_MERGE_CACHE_VERSION",
+            _workspace_module.AI_MERGE_CACHE_VERSION + 1,
+        )
+        assert _workspace_module._ai_merge_cache_path(task) != before
+
+    def test_ai_merge_cache_is_pruned(self, tmp_path, monkeypatch):
+        """Storing a merge evicts expired entries and the oldest beyond the cap."""
+        import os
+        import time
+
+        from core.workspace import _workspace_module
+
+        cache_dir = tmp_path / ".auto-claude" / "merge-cache"
+        cache_dir.mkdir(parents=True)
+        now = time.time()
+        expired = cache_dir / "expired.txt"
+        expired.write_text("old")
+        os.utime(expired, (now - 60 * 24 * 60 * 60,) * 2)
+        oldest = cache_dir / "oldest.txt"
+        oldest.write_text("older")
+        os.utime(oldest, (now - 120,) * 2)
+        recent = cache_dir / "recent.txt"
+        recent.write_text("recent")
+        os.utime(recent, (now - 60,) * 2)
+        monkeypatch.setattr(_workspace_module, "AI_MERGE_CACHE_MAX_ENTRIES", 2)
+
+        task = ParallelMergeTask(
+            file_path="src/test.py",
+            main_content="a",
+            worktree_content="b",
+            base_content="c",
+            spec_name="001-prune",
+            project_dir=tmp_path,
+        )
+        _workspace_module._store_ai_merge(task, "merged")
+
+        remaining = {p.name for p in cache_dir.iterdir()}
+        assert remaining == {
+            "recent.txt",
+            _workspace_module._ai_merge_cache_path(task).name,
+        }
+
     def test_no_base_but_identical(self, tmp_path):
         """When no base and both identical, return that version."""
         import asyncio
@@ -91,6 +91,22 @@ class TestHasUncommittedChanges:
         result = has_uncommitted_changes(temp_git_repo)
         assert result is True
 
+    def test_hung_git_times_out(self, temp_git_repo: Path, monkeypatch):
+        """A git that never prints or exits is killed after the timeout."""
+        import sys
+        import time
+
+        from core.workspace import git_utils
+
+        monkeypatch.setattr(git_utils, "get_git_executable", lambda: sys.executable)
+
+        start = time.monotonic()
+        result = git_utils._git_has_output(
+            temp_git_repo, ["-c", "import time; time.sleep(30)"], timeout=1
+        )
+        assert result is False
+        assert time.monotonic() - start < 10
+
 
 class TestGetCurrentBranch:
     """Tests for current branch detection."""
@@ -113,6 +129,225 @@ class TestGetCurrentBranch:
         assert branch == "feature/test-branch"
 
 
+class TestReadHeadSha:
+    """Tests for reading HEAD directly from the git directory."""
+
+    def test_matches_rev_parse_for_loose_and_packed_refs(self, temp_git_repo: Path):
+        """Loose and packed branch refs both resolve to the HEAD commit."""
+        from core.workspace.git_utils import _read_head_sha
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo, capture_output=True, text=True
+        ).stdout.strip()
+
+        assert _read_head_sha(temp_git_repo) == expected
+
+        subprocess.run(["git", "pack-refs", "--all"], cwd=temp_git_repo, capture_output=True)
+        assert _read_head_sha(temp_git_repo) == expected
+
+    def test_recreated_worktree_rereads_gitdir(self, temp_git_repo: Path, tmp_path: Path):
+        """A worktree re-created at the same path resolves to its new gitdir."""
+        from core.workspace.git_utils import _read_head_sha, _resolve_gitdir
+
+        worktree = tmp_path / "wt"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree)],
+            cwd=temp_git_repo, capture_output=True
+        )
+        first_gitdir = _resolve_gitdir(worktree)
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(worktree)],
+            cwd=temp_git_repo, capture_output=True
+        )
+        (temp_git_repo / "new.txt").write_text("new")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "advance"], cwd=temp_git_repo, capture_output=True)
+        # Occupy the old admin dir name so the re-created worktree gets a new one
+        first_gitdir.mkdir(parents=True)
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree)],
+            cwd=temp_git_repo, capture_output=True
+        )
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=worktree, capture_output=True, text=True
+        ).stdout.strip()
+        assert _resolve_gitdir(worktree) != first_gitdir
+        assert _read_head_sha(worktree) == expected
+
+    def test_non_git_directory_returns_none(self, temp_dir: Path):
+        """Non-git directory has no HEAD."""
+        from core.workspace.git_utils import _read_head_sha
+
+        assert _read_head_sha(temp_dir) is None
+
+
+class TestGitQueries:
+    """Tests for byte-output read-only git queries."""
+
+    def test_get_merge_base(self, temp_git_repo: Path):
+        """Merge-base of a branch with itself is its HEAD commit."""
+        from core.workspace.git_utils import get_merge_base
+
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo, capture_output=True, text=True
+        ).stdout.strip()
+
+        assert get_merge_base(temp_git_repo, "HEAD", "HEAD") == expected
+        assert get_merge_base(temp_git_repo, "HEAD", "no-such-ref") is None
+
+    def test_get_binary_file_content_from_ref(self, temp_git_repo: Path):
+        """Binary content is returned unmodified, missing paths give None."""
+        from core.workspace.git_utils import get_binary_file_content_from_ref
+
+        data = b"\x00\x01binary\n\n"
+        (temp_git_repo / "blob.bin").write_bytes(data)
+        subprocess.run(["git", "add", "blob.bin"], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "blob"], cwd=temp_git_repo, capture_output=True)
+
+        assert get_binary_file_content_from_ref(temp_git_repo, "HEAD", "blob.bin") == data
+        assert get_binary_file_content_from_ref(temp_git_repo, "HEAD", "missing.bin") is None
+
+    def test_blob_reader_matches_git_show(self, temp_git_repo: Path):
+        """GitBlobReader returns the same content as the per-file helpers."""
+        from core.workspace.git_utils import (
+            GitBlobReader,
+            get_binary_file_content_from_ref,
+            get_file_content_from_ref,
+        )
+
+        (temp_git_repo / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+        (temp_git_repo / "sub").mkdir()
+        (temp_git_repo / "sub" / "blob.bin").write_bytes(b"\x00\xff" * 50000)
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "files"], cwd=temp_git_repo, capture_output=True)
+
+        with GitBlobReader(temp_git_repo) as blobs:
+            for path in ["README.md", "crlf.txt", "missing.txt", "sub"]:
+                assert blobs.read_decoded("HEAD", path) == get_file_content_from_ref(
+                    temp_git_repo, "HEAD", path
+                )
+            assert blobs.read_bytes("HEAD", "sub/blob.bin") == (
+                get_binary_file_content_from_ref(temp_git_repo, "HEAD", "sub/blob.bin")
+            )
+            assert blobs.read_decoded("no-such-ref", "README.md") is None
+
+    def test_blob_reader_pygit2_matches_cat_file(self, temp_git_repo: Path):
+        """The libgit2 read path returns what the git cat-file path returns."""
+        pytest.importorskip("pygit2")
+        from core.workspace.git_utils import GitBlobReader
+
+        (temp_git_repo / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+        (temp_git_repo / "sub").mkdir()
+        (temp_git_repo / "sub" / "blob.bin").write_bytes(b"\x00\xff" * 50000)
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "files"], cwd=temp_git_repo, capture_output=True)
+
+        requests = [
+            ("HEAD", "crlf.txt"),
+            ("HEAD", "sub/blob.bin"),
+            ("HEAD~1", "README.md"),
+            ("HEAD~1", "crlf.txt"),
+            ("HEAD", "missing.txt"),
+            ("HEAD", "sub"),
+            ("HEAD~9", "README.md"),
+            ("no-such-ref", "README.md"),
+        ]
+        with GitBlobReader(temp_git_repo) as libgit2_blobs, GitBlobReader(
+            temp_git_repo
+        ) as git_blobs:
+            git_blobs._repo_broken = True  # Force the cat-file path
+            for ref, path in requests:
+                assert libgit2_blobs.read_bytes(ref, path) == git_blobs.read_bytes(
+                    ref, path
+                ), (ref, path)
+            assert libgit2_blobs._repo is not None
+            assert libgit2_blobs._proc is None
+
+    def test_changed_files_handles_unusual_names(self, temp_git_repo: Path):
+        """Changed-file listing keeps paths with tabs intact and splits renames."""
+        from core.workspace.git_utils import get_changed_files_from_branch
+
+        subprocess.run(["git", "checkout", "-b", "feature"], cwd=temp_git_repo, capture_output=True)
+        (temp_git_repo / "tab\tname.txt").write_text("new")
+        subprocess.run(["git", "mv", "README.md", "RENAMED.md"], cwd=temp_git_repo, capture_output=True)
+        (temp_git_repo / ".auto-claude").mkdir()
+        (temp_git_repo / ".auto-claude" / "state.json").write_text("{}")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "changes"], cwd=temp_git_repo, capture_output=True)
+
+        changed = get_changed_files_from_branch(temp_git_repo, "main", "feature")
+
+        assert sorted(changed) == [
+            ("README.md", "D"),
+            ("RENAMED.md", "A"),
+            ("tab\tname.txt", "A"),
+        ]
+
+    def test_get_blob_ids(self, temp_git_repo: Path):
+        """get_blob_ids returns matching IDs for identical content, None if missing."""
+        from core.workspace.git_utils import get_blob_ids
+
+        (temp_git_repo / "copy.md").write_bytes((temp_git_repo / "README.md").read_bytes())
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "copy"], cwd=temp_git_repo, capture_output=True)
+
+        readme, missing, copy = get_blob_ids(
+            temp_git_repo,
+            # "\x0c" is a line break to str.splitlines() but not to git
+            [("HEAD", "README.md"), ("HEAD", "miss\x0cing.txt"), ("HEAD", "copy.md")],
+        )
+        assert readme is not None and readme == copy
+        assert missing is None
+        assert get_blob_ids(temp_git_repo, []) == []
+
+    def test_blob_reader_shared_cache(self, temp_git_repo: Path):
+        """Readers sharing a cache only ask git once per (ref, path)."""
+        from core.workspace.git_utils import GitBlobReader
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        cache: dict = {}
+        with GitBlobReader(temp_git_repo, cache=cache) as blobs:
+            content = blobs.read_decoded(head, "README.md")
+            assert blobs.read_decoded(head, "missing.txt") is None
+
+        assert set(cache) == {(head, "README.md"), (head, "missing.txt")}
+        with GitBlobReader(temp_git_repo, cache=cache) as blobs:
+            assert blobs.read_decoded(head, "README.md") == content
+            assert blobs._proc is None
+
+
+    def test_blob_reader_times_out_wedged_git(self, temp_git_repo: Path):
+        """A cat-file process that stops answering is killed and git show is used."""
+        import sys
+        import time
+
+        from core.workspace.git_utils import GitBlobReader
+
+        with GitBlobReader(temp_git_repo, request_timeout=0.5) as blobs:
+            blobs._repo_broken = True  # Force the cat-file path
+            # Stands in for a git that accepts requests but never replies
+            blobs._proc = subprocess.Popen(
+                [sys.executable, "-c", "import time; time.sleep(60)"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            start = time.monotonic()
+            content = blobs.read_decoded("HEAD", "README.md")
+
+            assert time.monotonic() - start < 30
+            assert content == (temp_git_repo / "README.md").read_text()
+            assert blobs._broken is True
+            assert blobs._proc is None
+
+
 class TestGetExistingBuildWorktree:
     """Tests for existing build worktree detection."""
 
@@ -169,6 +404,24 @@ class TestSetupWorkspace:
 
         assert (temp_git_repo / ".auto-claude" / "worktrees" / "tasks").exists()
 
+    def test_setup_isolated_waits_for_timeline(self, temp_git_repo: Path, monkeypatch):
+        """Timeline tracking has finished by the time setup returns."""
+        import time
+
+        from core.workspace import setup as setup_module
+
+        finished = []
+
+        def slow_init(**kwargs):
+            time.sleep(0.2)
+            finished.append(kwargs["spec_name"])
+
+        monkeypatch.setattr(setup_module, "initialize_timeline_tracking", slow_init)
+
+        setup_workspace(temp_git_repo, TEST_SPEC_NAME, WorkspaceMode.ISOLATED)
+
+        assert finished == [TEST_SPEC_NAME]
+
 
 class TestWorkspaceUtilities:
     """Tests for workspace utility functions."""
@@ -187,6 +440,67 @@ class TestWorkspaceUtilities:
         # New path: .auto-claude/worktrees/tasks/{spec_name}
         assert working_dir.parent.name == "tasks"
 
+    def test_copy_spec_to_worktree_replaces_existing_copy(self, temp_dir: Path):
+        """Spec copy overwrites a previous copy and keeps nested files and mtimes."""
+        import os
+        import stat
+
+        from core.workspace.setup import copy_spec_to_worktree
+
+        source = temp_dir / "spec"
+        (source / "nested").mkdir(parents=True)
+        for i in range(20):
+            (source / "nested" / f"file{i}.md").write_text(f"content {i}")
+        (source / "plan.json").write_text("{}")
+        (source / "nested").chmod(0o750)
+        os.utime(source / "nested", ns=(1_000_000_000, 1_000_000_000))
+
+        worktree = temp_dir / "worktree"
+        stale = worktree / ".auto-claude" / "specs" / "001-spec" / "stale.txt"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old")
+
+        target = copy_spec_to_worktree(source, worktree, "001-spec")
+
+        assert not stale.exists()
+        assert (target / "plan.json").read_text() == "{}"
+        copied = target / "nested" / "file7.md"
+        assert copied.read_text() == "content 7"
+        original = source / "nested" / "file7.md"
+        assert copied.stat().st_mtime_ns == original.stat().st_mtime_ns
+        nested = (target / "nested").stat()
+        assert nested.st_mtime_ns == 1_000_000_000
+        assert stat.S_IMODE(nested.st_mode) == 0o750
+
+    def test_is_process_running(self):
+        """Live PIDs are reported as running, exited and invalid ones are not."""
+        import os
+
+        from core.workspace.git_utils import is_process_running
+
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+
+        assert is_process_running(os.getpid())
+        assert not is_process_running(proc.pid)
+        assert not is_process_running(-1)
+
+    def test_merge_lock_reclaims_stale_lock(self, temp_dir: Path):
+        """MergeLock writes its PID and replaces a lock left by a dead process."""
+        import os
+
+        from core.workspace.models import MergeLock
+
+        with MergeLock(temp_dir, "test-spec") as lock:
+            assert lock.lock_file.read_text() == str(os.getpid())
+        assert not lock.lock_file.exists()
+
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+        lock.lock_file.write_text(str(proc.pid))
+        with MergeLock(temp_dir, "test-spec") as lock:
+            assert lock.lock_file.read_text() == str(os.getpid())
+
 
 class TestWorkspaceIntegration:
     """Integration tests for workspace management."""
@@ -531,6 +845,234 @@ class TestMergeErrorHandling:
         assert merged_content == "worker content", "Merged file should have worktree content"
 
 
+class TestMergeHelpers:
+    """Tests for conflict-file, categorization and merged-output helpers."""
+
+    def test_create_conflict_file_with_git(self, temp_git_repo: Path):
+        """git merge-file merges clean changes and marks overlapping ones."""
+        from core.workspace.git_utils import create_conflict_file_with_git
+
+        base = "one\ntwo\nthree\nfour\n"
+        merged, had_conflicts = create_conflict_file_with_git(
+            "ONE\ntwo\nthree\nfour\n",
+            "one\ntwo\nthree\nFOUR\n",
+            base,
+            temp_git_repo,
+        )
+        assert (merged, had_conflicts) == ("ONE\ntwo\nthree\nFOUR\n", False)
+
+        merged, had_conflicts = create_conflict_file_with_git(
+            "main\n", "worktree\n", None, temp_git_repo
+        )
+        assert had_conflicts is True
+        assert "<<<<<<<" in merged and "main\n" in merged and "worktree\n" in merged
+
+    def test_is_binary_file_sniffs_content(self):
+        """Binaries are detected by extension, or by a NUL in the leading bytes."""
+        from core.workspace.git_utils import is_binary_file
+
+        assert is_binary_file("assets/logo.PNG") is True
+        assert is_binary_file("payload") is False
+        assert is_binary_file("payload", b"\x7fELF\x02\x00\x00") is True
+        assert is_binary_file("payload", b"plain text\n") is False
+        assert is_binary_file("payload", b"x" * 8000 + b"\0") is False
+
+    def test_repair_python_syntax_closes_brackets(self):
+        """Unclosed trailing brackets are closed; other errors are left to the AI."""
+        from core.workspace.git_utils import repair_python_syntax
+
+        sources = ("x = foo(1, [2,\n    3])\n", "x = foo(1, [2,\n    4])\n")
+        repaired = repair_python_syntax("x = foo(1, [2,\n    3", "a.py", sources)
+        assert repaired == "x = foo(1, [2,\n    3])\n"
+        assert repair_python_syntax("x = (1]", "a.py", sources) is None
+        assert repair_python_syntax("def f(:\n    pass\n", "a.py", sources) is None
+        assert repair_python_syntax("x = 1\n", "a.py", sources) is None
+
+    def test_repair_python_syntax_rejects_truncated_merge(self):
+        """A merge cut off mid-file compiles once closed, but must not be accepted."""
+        from core.workspace.git_utils import repair_python_syntax
+
+        functions = [f"def f{i}():\n    return g({i})\n\n\n" for i in range(5)]
+        main = "".join(functions) + "def main():\n    run(f0, f1)\n"
+        worktree = "".join(functions) + "def main():\n    run(f0, f2)\n"
+        # The AI stopped inside f2( - everything after it is missing
+        truncated = "".join(functions[:2]) + "def f2():\n    return g(2"
+
+        assert repair_python_syntax(truncated, "a.py", (main, worktree)) is None
+
+    def test_validate_merged_json_syntax(self, tmp_path: Path):
+        """JSON validation matches the stdlib verdict, whichever parser runs."""
+        from core.workspace.git_utils import validate_merged_syntax
+
+        assert validate_merged_syntax("a.json", '{"a": [1]}', tmp_path) == (True, "")
+        assert validate_merged_syntax("a.JSON", '{"a": NaN}', tmp_path) == (True, "")
+        is_valid, error = validate_merged_syntax("a.json", '{\n"a": }', tmp_path)
+        assert is_valid is False
+        assert error.startswith("JSON error:") and "line 2" in error
+
+    def test_categorize_new_file_keeps_raw_bytes(self, temp_git_repo: Path):
+        """Whole-file outcomes carry the blob bytes untouched (no newline rewrite)."""
+        from core.workspace import _workspace_module
+        from core.workspace.git_utils import GitBlobReader
+
+        data = b"line one\r\nline two\r\n"
+        (temp_git_repo / "crlf.txt").write_bytes(data)
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add crlf file"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+
+        with GitBlobReader(temp_git_repo) as blobs:
+            kind, payload = _workspace_module._categorize_conflicting_file(
+                blobs, "crlf.txt", "crlf.txt", "HEAD~1", "HEAD", None
+            )
+
+        assert kind == "new"
+        assert payload == data
+
+    def test_categorize_binary_modify_delete(self, temp_git_repo: Path):
+        """A binary on one branch only is "new"/"deleted", not a both-sides conflict."""
+        from core.workspace import _workspace_module
+        from core.workspace.git_utils import GitBlobReader
+
+        (temp_git_repo / "logo.png").write_bytes(b"\x89PNG base")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add logo"], cwd=temp_git_repo, capture_output=True
+        )
+        (temp_git_repo / "logo.png").write_bytes(b"\x89PNG spec")
+        subprocess.run(
+            ["git", "commit", "-am", "Modify logo"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "rm", "-q", "logo.png"], cwd=temp_git_repo, capture_output=True
+        )
+        subprocess.run(
+            ["git", "commit", "-m", "Delete logo"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+
+        with GitBlobReader(temp_git_repo) as blobs:
+            # Modified in the worktree, deleted on main
+            modified = _workspace_module._categorize_conflicting_file(
+                blobs, "logo.png", "logo.png", "HEAD", "HEAD~1", "HEAD~2"
+            )
+            # Deleted in the worktree, modified on main
+            deleted = _workspace_module._categorize_conflicting_file(
+                blobs, "logo.png", "logo.png", "HEAD~1", "HEAD", "HEAD~2"
+            )
+
+        assert modified == ("new", b"\x89PNG spec")
+        assert deleted == ("deleted", None)
+
+
+class TestResolveGitConflicts:
+    """Tests for resolving git-level conflicts file by file."""
+
+    def _conflict_on_both_branches(self, repo: Path, path: str, base, main, spec):
+        """Commit base, then diverging main and spec versions of one file."""
+        write = Path.write_bytes if isinstance(base, bytes) else Path.write_text
+        write(repo / path, base)
+        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "base"], cwd=repo, capture_output=True)
+        main_branch = get_current_branch(repo)
+
+        subprocess.run(
+            ["git", "checkout", "-b", "auto-claude/spec"], cwd=repo, capture_output=True
+        )
+        write(repo / path, spec)
+        subprocess.run(["git", "commit", "-am", "spec"], cwd=repo, capture_output=True)
+        subprocess.run(["git", "checkout", main_branch], cwd=repo, capture_output=True)
+        write(repo / path, main)
+        subprocess.run(["git", "commit", "-am", "main"], cwd=repo, capture_output=True)
+        return {
+            "conflicting_files": [path],
+            "base_branch": main_branch,
+            "spec_branch": "auto-claude/spec",
+        }
+
+    def _assert_needs_review(self, repo: Path, path: str, result: dict, spec):
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"],
+            cwd=repo, capture_output=True, text=True
+        ).stdout.split()
+        read = Path.read_bytes if isinstance(spec, bytes) else Path.read_text
+        assert result["success"] is False
+        assert path not in result["resolved_files"]
+        assert [c["file"] for c in result["remaining_conflicts"]] == [path]
+        assert path not in staged
+        assert read(repo / path) == spec
+
+    def test_binary_conflict_needs_review(self, temp_git_repo: Path):
+        """A binary changed on both sides is reported, not silently resolved."""
+        from core.workspace import _workspace_module
+
+        conflicts = self._conflict_on_both_branches(
+            temp_git_repo, "logo.png", b"\x89PNG base", b"\x89PNG main", b"\x89PNG spec"
+        )
+
+        result = _workspace_module._resolve_git_conflicts_with_ai(
+            temp_git_repo, "spec", temp_git_repo, conflicts, orchestrator=None
+        )
+
+        self._assert_needs_review(temp_git_repo, "logo.png", result, b"\x89PNG spec")
+        assert "binary" in result["remaining_conflicts"][0]["reason"]
+
+    def test_oversized_text_conflict_needs_review(self, temp_git_repo: Path):
+        """A text conflict over the AI line limit is reported, not silently resolved."""
+        from core.workspace import _workspace_module
+        from core.workspace.git_utils import MAX_FILE_LINES_FOR_AI
+
+        body = "".join(f"line {i}\n" for i in range(MAX_FILE_LINES_FOR_AI + 10))
+        conflicts = self._conflict_on_both_branches(
+            temp_git_repo, "big.txt", "top\n" + body, "main\n" + body, "spec\n" + body
+        )
+
+        result = _workspace_module._resolve_git_conflicts_with_ai(
+            temp_git_repo, "spec", temp_git_repo, conflicts, orchestrator=None
+        )
+
+        self._assert_needs_review(temp_git_repo, "big.txt", result, "spec\n" + body)
+        assert "too large" in result["remaining_conflicts"][0]["reason"]
+
+    def test_stage_files_survives_unmatched_path(self, temp_git_repo: Path):
+        """One path git can't match doesn't keep the others from being staged."""
+        from core.workspace import _workspace_module
+
+        (temp_git_repo / "resolved.txt").write_text("resolved\n")
+        (temp_git_repo / "README.md").unlink()
+
+        failed = _workspace_module._stage_files(
+            temp_git_repo, ["resolved.txt", "never-tracked.txt", "README.md"]
+        )
+
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-status"],
+            cwd=temp_git_repo, capture_output=True, text=True
+        ).stdout.splitlines()
+        assert failed == ["never-tracked.txt"]
+        assert sorted(staged) == ["A\tresolved.txt", "D\tREADME.md"]
+
+    def test_preview_conflicts_list_paths(self, temp_git_repo: Path):
+        """The merge preview names conflicted paths, quoted-looking ones included."""
+        from cli.workspace_commands import _check_git_merge_conflicts
+
+        conflicts = self._conflict_on_both_branches(
+            temp_git_repo, "naïve notes.txt", "base\n", "main\n", "spec\n"
+        )
+
+        result = _check_git_merge_conflicts(
+            temp_git_repo, "spec", base_branch=conflicts["base_branch"]
+        )
+
+        assert result["has_conflicts"] is True
+        assert result["conflicting_files"] == ["naïve notes.txt"]
+
 class TestRebaseDetection:
     """Tests for automatic rebase detection (ACS-224)."""
 
@@ -654,6 +1196,50 @@ class TestRebaseDetection:
         assert result.get("needs_rebase") is True
         assert result.get("commits_behind") == 3, "Should count all commits behind"
 
+    def test_check_git_conflicts_lists_conflicting_files(self, temp_git_repo: Path):
+        """_check_git_conflicts reports paths both branches changed incompatibly."""
+        from core.workspace import _check_git_conflicts
+
+        spec_branch = "auto-claude/test-spec"
+        subprocess.run(
+            ["git", "checkout", "-b", spec_branch],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+        (temp_git_repo / "README.md").write_text("# Spec version\n")
+        (temp_git_repo / "spec-only.txt").write_text("spec content")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Spec commit"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+
+        subprocess.run(
+            ["git", "checkout", "main"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+        (temp_git_repo / "README.md").write_text("# Main version\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Main commit"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+
+        result = _check_git_conflicts(temp_git_repo, "test-spec")
+
+        assert result["has_conflicts"] is True
+        assert result["conflicting_files"] == ["README.md"]
+        merge_base = subprocess.run(
+            ["git", "merge-base", "main", spec_branch],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert result["merge_base"] == merge_base
+
 
 class TestRebaseSpecBranch:
     """Tests for _rebase_spec_branch function (ACS-224)."""
@@ -1062,3 +1648,27 @@ class TestRebaseErrorHandling:
                 cwd=temp_git_repo,
                 capture_output=True,
             )
+
+
+class TestMergeComponentCache:
+    """Tests for reusing the timeline tracker and orchestrator between merges."""
+
+    def test_reused_until_head_moves(self, temp_git_repo: Path):
+        """Components are cached per project and rebuilt after a new commit."""
+        from core.workspace import _workspace_module, invalidate_merge_components
+
+        get_components = _workspace_module._get_merge_components
+        invalidate_merge_components()
+
+        tracker, orchestrator = get_components(temp_git_repo)
+        assert get_components(temp_git_repo) == (tracker, orchestrator)
+
+        (temp_git_repo / "new.txt").write_text("new")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "advance"], cwd=temp_git_repo, capture_output=True)
+
+        _, rebuilt = get_components(temp_git_repo)
+        assert rebuilt is not orchestrator
+
+        invalidate_merge_components(temp_git_repo)
+        assert get_components(temp_git_repo)[1] is not rebuilt
@@ -462,6 +462,26 @@ class TestChangeTracking:
         file_names = [f[1] for f in files]
         assert "added.txt" in file_names
 
+    def test_get_change_report(self, temp_git_repo: Path):
+        """get_change_report returns the summary and file list from one diff."""
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("test-spec")
+
+        (info.path / "new-file.txt").write_text("new")
+        (info.path / "README.md").write_text("modified")
+        subprocess.run(["git", "add", "."], cwd=info.path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Changes"],
+            cwd=info.path, capture_output=True
+        )
+
+        summary, files = manager.get_change_report("test-spec")
+
+        assert summary == manager.get_change_summary("test-spec")
+        assert files == manager.get_changed_files("test-spec")
+        assert summary == {"new_files": 1, "modified_files": 1, "deleted_files": 0}
+
 
 class TestWorktreeUtilities:
     """Tests for utility methods."""